@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Бенчмарк поиска соседей в Flock: полный перебор, сетка и KD-дерево на торе.
+# Плотность как в лабе (N=60 на 100×100), поэтому поле растёт вместе с N.
+
+import argparse
+import math
+import time
+import numpy as np
+import model
+from flock import Flock
+
+
+def make_flock(n, mode, seed=0):
+    """Случайная стая из n агентов на поле с плотностью лабы."""
+    side = 100 * math.sqrt(n / 60)
+    rng = np.random.default_rng(seed)
+    x, y = rng.uniform(0, side, n), rng.uniform(0, side, n)
+    vx, vy = rng.uniform(-1, 1, n), rng.uniform(-1, 1, n)
+    return Flock(x, y, vx, vy, **model.params(W=side, H=side), mode=mode, periodic=True)
+
+
+def best_time(fn, repeat):
+    """Лучшее время из repeat запусков (сек.)."""
+    best = math.inf
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Бенчмарк поиска соседей (brute / grid / kdtree)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="Числа агентов")
+    ap.add_argument("--repeat", type=int, default=3, help="Повторов на замер")
+    ap.add_argument("--brute-max", type=int, default=20000, help="Выше этого N перебор O(N²) пропускается")
+    args = ap.parse_args()
+
+    modes = ("brute", "grid", "kdtree")
+    print(f"{'N':>8} " + " ".join(f"{m + ', мс':>12}" for m in modes) + f" {'пар':>10}")
+    for n in args.sizes:
+        row, pairs = [], None
+        for m in modes:
+            if m == "brute" and n > args.brute_max:
+                row.append(f"{'—':>12}")
+                continue
+            fl = make_flock(n, m)
+            pairs = len(fl.pairs()[0])
+            row.append(f"{best_time(fl.pairs, args.repeat) * 1e3:12.1f}")
+        print(f"{n:8d} " + " ".join(row) + f" {pairs:10d}")
+
+
+if __name__ == "__main__":
+    main()
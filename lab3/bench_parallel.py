@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Бенчмарк параллельного шага: ускорение ParallelFlock относительно Flock.step
+# в зависимости от числа процессов, с проверкой совпадения состояния бит в бит.
+
+import argparse
+import math
+import os
+import time
+import model
+from flock import Flock
+from parallel import ParallelFlock
+
+
+def make_args(n, seed=0):
+    """Начальная стая и параметры на поле с плотностью лабы."""
+    side = 100 * math.sqrt(n / 60)
+    a = model.init_agents(seed, n, side, side)
+    cols = ([g.x for g in a], [g.y for g in a], [g.vx for g in a], [g.vy for g in a])
+    return cols, dict(model.params(W=side, H=side), periodic=True)
+
+
+def timed(flock, steps):
+    """Время steps шагов (сек.)."""
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        flock.step()
+    return time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Бенчмарк ParallelFlock: ускорение от числа процессов")
+    ap.add_argument("--n", type=int, default=100000, help="Число агентов")
+    ap.add_argument("--steps", type=int, default=10, help="Шагов на замер")
+    ap.add_argument("--workers", type=int, nargs="+", default=None, help="Числа процессов (по умолчанию 1..CPU)")
+    args = ap.parse_args()
+    workers = args.workers or list(range(1, (os.cpu_count() or 1) + 1))
+
+    cols, kw = make_args(args.n)
+    serial = Flock(*cols, **kw)
+    t1 = timed(serial, args.steps)
+    print(f"N={args.n}, шагов={args.steps}, CPU={os.cpu_count()}")
+    print(f"{'процессов':>10} {'с/шаг':>10} {'ускорение':>10} {'совпадает':>10}")
+    print(f"{'serial':>10} {t1 / args.steps:10.3f} {1.0:10.2f} {'—':>10}")
+    for w in workers:
+        with ParallelFlock(*cols, **kw, workers=w) as par:
+            t = timed(par, args.steps)
+            same = bool((par.state == serial.state).all())
+        print(f"{w:10d} {t / args.steps:10.3f} {t1 / t:10.2f} {str(same):>10}")
+
+
+if __name__ == "__main__":
+    main()
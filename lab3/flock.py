@@ -0,0 +1,177 @@
+# Движок стаи в виде структуры массивов (SoA): x, y, vx, vy — непрерывные float64-массивы,
+# все три правила, ограничения и wrap считаются пакетными операциями NumPy.
+# Результат совпадает с объектным путём (Agent + step() из main.py) с точностью ~1e-12
+# за шаг из одного и того же состояния: np.hypot/np.sqrt и math.hypot/** 0.5
+# могут расходиться в последнем бите. Порядок суммирования по соседям тот же (по j),
+# поэтому суммы не вносят дополнительной погрешности.
+# periodic=True — плоскость считается тором: соседи ищутся через шов, а смещения
+# берутся по кратчайшему образу (minimum image).
+
+import numpy as np
+
+BRUTE_CHUNK = 1024   # строк матрицы расстояний за раз в режиме "brute"
+
+
+class Flock:
+    def __init__(self, x, y, vx, vy, W, H, radius, sep, max_speed, wc, wa, ws, steer_limit,
+                 mode="grid", periodic=False):
+        # одно хранилище 4×N: строки — непрерывные массивы x, y, vx, vy
+        self.state = np.array([x, y, vx, vy], dtype=np.float64)
+        self.x, self.y, self.vx, self.vy = self.state
+        self.W, self.H = W, H
+        self.radius, self.sep, self.max_speed = radius, sep, max_speed
+        self.wc, self.wa, self.ws = wc, wa, ws
+        self.steer_limit = steer_limit
+        self.mode = mode   # "grid" — сетка, "kdtree" — KD-дерево (scipy), "brute" — полный перебор
+        self.periodic = periodic
+        self.nx = max(1, int(W // radius))
+        self.ny = max(1, int(H // radius))
+
+    @classmethod
+    def from_agents(cls, agents, *params, **kw):
+        """Стая из списка Agent (остальные аргументы — как у конструктора)."""
+        return cls([a.x for a in agents], [a.y for a in agents],
+                   [a.vx for a in agents], [a.vy for a in agents], *params, **kw)
+
+    def __len__(self):
+        return self.state.shape[1]
+
+    def positions(self):
+        """Позиции в виде массива N×2 (копия)."""
+        return self.state[:2].T.copy()
+
+    def _wrap(self, dx, dy):
+        """Смещения по кратчайшему образу на торе (на месте); без periodic — как есть."""
+        if self.periodic:
+            dx -= self.W * np.rint(dx / self.W)
+            dy -= self.H * np.rint(dy / self.H)
+        return dx, dy
+
+    def offsets(self, ii, jj):
+        """Векторы от соседа j к агенту i и расстояния между ними."""
+        dx, dy = self._wrap(self.x[ii] - self.x[jj], self.y[ii] - self.y[jj])
+        return dx, dy, np.hypot(dx, dy)
+
+    def _pairs_brute(self):
+        """Пары соседей полным перебором: матрица расстояний по блокам строк."""
+        x, y = self.x, self.y
+        iis, jjs = [], []
+        for s in range(0, len(x), BRUTE_CHUNK):
+            d = np.hypot(*self._wrap(x[s:s+BRUTE_CHUNK, None] - x, y[s:s+BRUTE_CHUNK, None] - y))
+            ii, jj = np.nonzero(d <= self.radius)
+            ii += s
+            keep = ii != jj
+            iis.append(ii[keep])
+            jjs.append(jj[keep])
+        # np.nonzero идёт по строкам — пары уже упорядочены по (i, j)
+        return np.concatenate(iis), np.concatenate(jjs)
+
+    def _pairs_grid(self):
+        """Пары соседей через сетку: кандидаты только из 3×3 клеток (с зацикливанием)."""
+        x, y = self.x, self.y
+        n, nx, ny = len(x), self.nx, self.ny
+        cx = (x // (self.W / nx)).astype(np.int64) % nx
+        cy = (y // (self.H / ny)).astype(np.int64) % ny
+        cell = cx * ny + cy
+        order = np.argsort(cell, kind="stable")
+        counts = np.bincount(cell, minlength=nx * ny)
+        starts = np.cumsum(counts) - counts
+        idx = np.arange(n)
+        iis, jjs = [], []
+        for dx in sorted({d % nx for d in (-1, 0, 1)}):
+            for dy in sorted({d % ny for d in (-1, 0, 1)}):
+                nc = ((cx + dx) % nx) * ny + (cy + dy) % ny
+                k = counts[nc]
+                ii = np.repeat(idx, k)
+                # позиция кандидата внутри своей клетки: 0..k-1 для каждого агента
+                off = np.arange(len(ii)) - np.repeat(np.cumsum(k) - k, k)
+                jj = order[np.repeat(starts[nc], k) + off]
+                keep = (ii != jj) & (self.offsets(ii, jj)[2] <= self.radius)
+                iis.append(ii[keep])
+                jjs.append(jj[keep])
+        ii, jj = np.concatenate(iis), np.concatenate(jjs)
+        o = np.lexsort((jj, ii))
+        return ii[o], jj[o]
+
+    def _pairs_kdtree(self):
+        """Пары соседей через KD-дерево; при periodic — с зацикленным боксом (W, H)."""
+        from scipy.spatial import cKDTree   # необязательная зависимость, нужна только здесь
+
+        pos = self.state[:2].T
+        box = None
+        if self.periodic:
+            # cKDTree требует координаты строго в [0, L): mod может вернуть ровно L
+            pos = np.where(pos >= (self.W, self.H), 0.0, pos)
+            box = (self.W, self.H)
+        tree = cKDTree(pos, boxsize=box)
+        # запас по радиусу и отбор тем же np.hypot — набор пар как у "grid"/"brute"
+        p = tree.query_pairs(self.radius * (1 + 1e-9), output_type="ndarray")
+        ii = np.concatenate([p[:, 0], p[:, 1]])
+        jj = np.concatenate([p[:, 1], p[:, 0]])
+        keep = self.offsets(ii, jj)[2] <= self.radius
+        ii, jj = ii[keep], jj[keep]
+        o = np.lexsort((jj, ii))
+        return ii[o], jj[o]
+
+    def pairs(self):
+        """Все пары соседей (i, j), i != j, упорядоченные по i, затем по j."""
+        if self.mode == "grid":
+            return self._pairs_grid()
+        if self.mode == "kdtree":
+            return self._pairs_kdtree()
+        return self._pairs_brute()
+
+    def accelerations(self, ii, jj):
+        """Управляющие ускорения (ax, ay) по трём правилам для заданных пар соседей."""
+        x, y, vx, vy = self.state
+        n = len(x)
+        cnt = np.bincount(ii, minlength=n)
+        c = np.maximum(cnt, 1)
+
+        dx, dy, d = self.offsets(ii, jj)
+
+        # cohesion и alignment — средние по соседям минус собственное значение
+        if self.periodic:
+            # на торе центр масс считается через смещения к соседям
+            cx = -np.bincount(ii, dx, n) / c
+            cy = -np.bincount(ii, dy, n) / c
+        else:
+            cx = np.bincount(ii, x[jj], n) / c - x
+            cy = np.bincount(ii, y[jj], n) / c - y
+        avx = np.bincount(ii, vx[jj], n) / c - vx
+        avy = np.bincount(ii, vy[jj], n) / c - vy
+
+        # separation — единичные векторы от слишком близких соседей
+        close = (d > 0) & (d < self.sep)
+        sx = np.bincount(ii[close], dx[close] / d[close], n)
+        sy = np.bincount(ii[close], dy[close] / d[close], n)
+
+        ax = self.wc*cx + self.wa*avx + self.ws*sx
+        ay = self.wc*cy + self.wa*avy + self.ws*sy
+        ax[cnt == 0] = 0.0   # без соседей ускорения нет
+        ay[cnt == 0] = 0.0
+
+        # мягкое ограничение ускорения
+        a = np.hypot(ax, ay)
+        big = a > self.steer_limit
+        k = self.steer_limit / a[big]
+        ax[big] *= k
+        ay[big] *= k
+        return ax, ay
+
+    def apply(self, ax, ay):
+        """Аналог Agent.apply для всей стаи: ускорение, лимит скорости, wrap."""
+        x, y, vx, vy = self.state
+        vx += ax
+        vy += ay
+        s = np.sqrt(vx*vx + vy*vy)
+        fast = s > self.max_speed
+        k = self.max_speed / s[fast]
+        vx[fast] *= k
+        vy[fast] *= k
+        np.mod(x + vx, self.W, out=x)
+        np.mod(y + vy, self.H, out=y)
+
+    def step(self):
+        """Один шаг модели для всей стаи."""
+        self.apply(*self.accelerations(*self.pairs()))
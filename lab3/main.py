@@ -1,101 +1,99 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import math
-import random
+import argparse
+import json
+import os
+import sys
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
-from agent import Agent
-
-# параметры модели
-W, H = 100, 100          # размеры плоскости
-N = 60                   # число агентов
-RADIUS = 15.0            # радиус поиска соседей
-SEP = 8.0                # дистанция для «разделения» (анти-столкновения)
-MAX_SPEED = 2.5          # максимальная скорость
-WC, WA, WS = 0.01, 0.05, 0.10  # веса правил: cohesion / alignment / separation
-STEER_LIMIT = 0.5        # мягкий лимит ускорения (сглаживает повороты)
-
-random.seed(0)           # фиксируем случайность для воспроизводимых запусков
-
-# инициализация стаи: случайные позиции и скорости
-agents = []
-for _ in range(N):
-    ang = random.uniform(0, 2*math.pi)
-    spd = random.uniform(0.5*MAX_SPEED, MAX_SPEED)
-    x = random.uniform(0, W)
-    y = random.uniform(0, H)
-    agents.append(Agent(x, y, math.cos(ang)*spd, math.sin(ang)*spd))
-
-def neighbors(i):
-    """Возвращает индексы соседей агента i в радиусе RADIUS (евклидово расстояние)."""
-    xi, yi = agents[i].x, agents[i].y
-    n = []
-    for j, a in enumerate(agents):
-        if j == i:
-            continue
-        if math.hypot(xi - a.x, yi - a.y) <= RADIUS:
-            n.append(j)
-    return n
-
-def step():
-    """Один шаг модели: считаем три вектора для каждого агента и обновляем состояние."""
-    ax = [0.0]*N
-    ay = [0.0]*N
-    for i in range(N):
-        nb = neighbors(i)
-        if not nb:
-            continue
-
-        # cohesion — вектор к центру масс соседей
-        cx = sum(agents[j].x for j in nb)/len(nb) - agents[i].x
-        cy = sum(agents[j].y for j in nb)/len(nb) - agents[i].y
-
-        # alignment — вектор к средней скорости соседей
-        avx = sum(agents[j].vx for j in nb)/len(nb) - agents[i].vx
-        avy = sum(agents[j].vy for j in nb)/len(nb) - agents[i].vy
-
-        # separation — отталкивание от слишком близких
-        sx = sy = 0.0
-        xi, yi = agents[i].x, agents[i].y
-        for j in nb:
-            dx = xi - agents[j].x
-            dy = yi - agents[j].y
-            d = math.hypot(dx, dy)
-            if 0 < d < SEP:
-                sx += dx/d
-                sy += dy/d
-
-        # взвешенная сумма трёх эффектов
-        ax[i] = WC*cx + WA*avx + WS*sx
-        ay[i] = WC*cy + WA*avy + WS*sy
-
-        # мягкое ограничение мгновенного «поворота» (ускорения)
-        a = math.hypot(ax[i], ay[i])
-        if a > STEER_LIMIT and a > 0:
-            k = STEER_LIMIT / a
-            ax[i] *= k
-            ay[i] *= k
-
-    # применяем ускорения ко всем агентам (ограничение скорости и wrap внутри Agent.apply)
-    for i in range(N):
-        agents[i].apply(ax[i], ay[i], MAX_SPEED, W, H)
-
-# визуализация (Matplotlib)
-fig, axp = plt.subplots(figsize=(6, 6))
-axp.set_xlim(0, W)
-axp.set_ylim(0, H)
-axp.set_aspect('equal')
-axp.set_title('Boids — Лаба ИИ №3')
-
-dots = axp.scatter([a.x for a in agents], [a.y for a in agents], s=22)
-
-def update(_):
-    """Колбэк анимации: шаг модели + обновление точек."""
-    step()
-    dots.set_offsets([(a.x, a.y) for a in agents])
-    return dots,
+import model
+from model import W, H, N, ENGINE, step, make_flock, check_modes, check_engine
+
+# параметры отрисовки
+INTERVAL = 35            # мс между кадрами
+STEPS_PER_FRAME = 1      # шагов модели на один нарисованный кадр
+DECIMATE = 1             # рисуем каждого k-го агента (для больших стай)
+BLIT = True              # перерисовываем только точки, а не всю фигуру
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Boids — Лаба ИИ №3")
+    ap.add_argument("--check", action="store_true", help="Сверка режимов и движков без окна")
+    ap.add_argument("--replay", type=str, default=None, help="Проиграть траекторию из runner.py")
+    ap.add_argument("--engine", choices=["agents", "flock"], default=ENGINE, help="Движок модели")
+    ap.add_argument("--n", type=int, default=N, help="Число агентов")
+    ap.add_argument("--width", type=float, default=W, help="Ширина поля")
+    ap.add_argument("--height", type=float, default=H, help="Высота поля")
+    ap.add_argument("--steps-per-frame", type=int, default=STEPS_PER_FRAME, help="Шагов модели на кадр")
+    ap.add_argument("--decimate", type=int, default=DECIMATE, help="Рисовать каждого k-го агента")
+    ap.add_argument("--interval", type=int, default=INTERVAL, help="Мс между кадрами")
+    ap.add_argument("--no-blit", action="store_true", help="Отключить blitting")
+    return ap.parse_args()
+
+def make_source(args):
+    """
+    Источник кадров: функция advance(m) делает m шагов и возвращает позиции N×2.
+    Для Flock и траектории это view на массив движка (без списков и лишних копий).
+    """
+    k = args.decimate
+    if args.replay:
+        replay = np.load(args.replay, mmap_mode='r')
+        pos = {"frame": 0}
+        def advance(m):
+            pos["frame"] = (pos["frame"] + m) % len(replay)
+            return replay[pos["frame"], :2, ::k].T
+        return advance
+    if args.engine == "flock":
+        flock = make_flock(model.init_agents(0, args.n, args.width, args.height),
+                           W=args.width, H=args.height)
+        def advance(m):
+            for _ in range(m):
+                flock.step()
+            return flock.state[:2, ::k].T
+        return advance
+    model.agents = model.init_agents(0, args.n, args.width, args.height)
+    def advance(m):
+        for _ in range(m):
+            step()
+        return [(a.x, a.y) for a in model.agents[::k]]
+    return advance
+
+def main():
+    args = parse_args()
+    if args.check:
+        # сверка сетки с полным перебором и Flock с объектами — без окна
+        print("grid == brute:", check_modes())
+        print("Flock vs Agent, max |Δ| за шаг:", check_engine())
+        return
+    if args.replay and os.path.exists(args.replay + '.json'):
+        # размеры поля берём из параметров сохранённого прогона
+        with open(args.replay + '.json', encoding='utf-8') as f:
+            meta = json.load(f)['params']
+        args.width, args.height = meta['W'], meta['H']
+    if args.engine == "agents" and not args.replay and (args.width, args.height) != (W, H):
+        sys.exit("Объектный движок работает на поле W×H из model.py; для другого поля — --engine flock")
+
+    # визуализация (Matplotlib)
+    fig, axp = plt.subplots(figsize=(6, 6))
+    axp.set_xlim(0, args.width)
+    axp.set_ylim(0, args.height)
+    axp.set_aspect('equal')
+    axp.set_title('Boids — Лаба ИИ №3')
+
+    advance = make_source(args)
+    first = np.asarray(advance(0), dtype=float)
+    dots = axp.scatter(first[:, 0], first[:, 1], s=22 if len(first) <= 1000 else 2)
+
+    def update(_):
+        """Колбэк анимации: steps_per_frame шагов модели + обновление точек."""
+        dots.set_offsets(advance(args.steps_per_frame))
+        return dots,
+
+    anim = FuncAnimation(fig, update, interval=args.interval, blit=BLIT and not args.no_blit,
+                         cache_frame_data=False)
+    plt.show()
+    return anim
 
 if __name__ == '__main__':
-    anim = FuncAnimation(fig, update, interval=35, blit=False, cache_frame_data=False)
-    plt.show()
\ No newline at end of file
+    main()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Модель Boids без визуализации: параметры, инициализация, поиск соседей и шаг.
+# Matplotlib здесь не импортируется — модуль можно использовать на серверах (см. runner.py).
+
+import math
+import random
+from agent import Agent
+from spatial import SpatialGrid
+from flock import Flock
+
+# параметры модели
+W, H = 100, 100          # размеры плоскости
+N = 60                   # число агентов
+RADIUS = 15.0            # радиус поиска соседей
+SEP = 8.0                # дистанция для «разделения» (анти-столкновения)
+MAX_SPEED = 2.5          # максимальная скорость
+WC, WA, WS = 0.01, 0.05, 0.10  # веса правил: cohesion / alignment / separation
+STEER_LIMIT = 0.5        # мягкий лимит ускорения (сглаживает повороты)
+NEIGHBOR_MODE = "grid"   # поиск соседей: "grid" — пространственная сетка, "brute" — полный перебор
+PERIODIC = True          # тор: соседи видны через края, смещения — по кратчайшему образу
+ENGINE = "agents"        # движок: "agents" — объекты Agent, "flock" — массивы NumPy (Flock)
+
+def init_agents(seed=0, n=N, w=W, h=H):
+    """Инициализация стаи: случайные позиции и скорости (seed фиксирует запуск)."""
+    random.seed(seed)
+    res = []
+    for _ in range(n):
+        ang = random.uniform(0, 2*math.pi)
+        spd = random.uniform(0.5*MAX_SPEED, MAX_SPEED)
+        x = random.uniform(0, w)
+        y = random.uniform(0, h)
+        res.append(Agent(x, y, math.cos(ang)*spd, math.sin(ang)*spd))
+    return res
+
+agents = init_agents(0)
+grid = SpatialGrid(W, H, RADIUS)   # клетка = RADIUS, перестраивается в начале каждого step()
+
+def offset(xi, yi, a):
+    """Вектор от агента a к точке (xi, yi); при PERIODIC — по кратчайшему пути на торе."""
+    dx = xi - a.x
+    dy = yi - a.y
+    if PERIODIC:
+        dx -= W * round(dx / W)
+        dy -= H * round(dy / H)
+    return dx, dy
+
+def neighbors_brute(i):
+    """Возвращает индексы соседей агента i в радиусе RADIUS (евклидово расстояние), O(N)."""
+    xi, yi = agents[i].x, agents[i].y
+    n = []
+    for j, a in enumerate(agents):
+        if j == i:
+            continue
+        if math.hypot(*offset(xi, yi, a)) <= RADIUS:
+            n.append(j)
+    return n
+
+def neighbors_grid(i):
+    """То же, что neighbors_brute, но кандидаты берутся только из 3×3 клеток сетки."""
+    xi, yi = agents[i].x, agents[i].y
+    n = []
+    for j in grid.candidates(xi, yi):
+        if j == i:
+            continue
+        if math.hypot(*offset(xi, yi, agents[j])) <= RADIUS:
+            n.append(j)
+    n.sort()   # порядок как у перебора — суммы ниже совпадают бит в бит
+    return n
+
+def neighbors(i):
+    """Индексы соседей агента i выбранным способом (NEIGHBOR_MODE)."""
+    return neighbors_grid(i) if NEIGHBOR_MODE == "grid" else neighbors_brute(i)
+
+def step():
+    """Один шаг модели: считаем три вектора для каждого агента и обновляем состояние."""
+    n = len(agents)
+    if NEIGHBOR_MODE == "grid":
+        grid.rebuild(agents)
+    ax = [0.0]*n
+    ay = [0.0]*n
+    for i in range(n):
+        nb = neighbors(i)
+        if not nb:
+            continue
+
+        xi, yi = agents[i].x, agents[i].y
+        offs = [offset(xi, yi, agents[j]) for j in nb]
+
+        # cohesion — вектор к центру масс соседей (на торе — через смещения к соседям)
+        if PERIODIC:
+            cx = -sum(dx for dx, _ in offs)/len(nb)
+            cy = -sum(dy for _, dy in offs)/len(nb)
+        else:
+            cx = sum(agents[j].x for j in nb)/len(nb) - xi
+            cy = sum(agents[j].y for j in nb)/len(nb) - yi
+
+        # alignment — вектор к средней скорости соседей
+        avx = sum(agents[j].vx for j in nb)/len(nb) - agents[i].vx
+        avy = sum(agents[j].vy for j in nb)/len(nb) - agents[i].vy
+
+        # separation — отталкивание от слишком близких
+        sx = sy = 0.0
+        for dx, dy in offs:
+            d = math.hypot(dx, dy)
+            if 0 < d < SEP:
+                sx += dx/d
+                sy += dy/d
+
+        # взвешенная сумма трёх эффектов
+        ax[i] = WC*cx + WA*avx + WS*sx
+        ay[i] = WC*cy + WA*avy + WS*sy
+
+        # мягкое ограничение мгновенного «поворота» (ускорения)
+        a = math.hypot(ax[i], ay[i])
+        if a > STEER_LIMIT and a > 0:
+            k = STEER_LIMIT / a
+            ax[i] *= k
+            ay[i] *= k
+
+    # применяем ускорения ко всем агентам (ограничение скорости и wrap внутри Agent.apply)
+    for i in range(n):
+        agents[i].apply(ax[i], ay[i], MAX_SPEED, W, H)
+
+def check_modes(steps=200, seed=0, n=N):
+    """Сверка режимов: сетка и полный перебор должны дать одинаковые траектории."""
+    global agents, NEIGHBOR_MODE
+    saved = agents, NEIGHBOR_MODE
+    runs = {}
+    for mode in ("brute", "grid"):
+        agents, NEIGHBOR_MODE = init_agents(seed, n), mode
+        for _ in range(steps):
+            step()
+        runs[mode] = [(a.x, a.y, a.vx, a.vy) for a in agents]
+    agents, NEIGHBOR_MODE = saved
+    return runs["brute"] == runs["grid"]
+
+def params(**over):
+    """Параметры Flock из констант модуля; отдельные можно переопределить (W=..., wc=...)."""
+    p = dict(W=W, H=H, radius=RADIUS, sep=SEP, max_speed=MAX_SPEED,
+             wc=WC, wa=WA, ws=WS, steer_limit=STEER_LIMIT)
+    p.update(over)
+    return p
+
+def make_flock(agents, mode=None, **over):
+    """Перенос стаи в NumPy-движок Flock с текущими параметрами модели."""
+    return Flock.from_agents(agents, **params(**over), mode=mode or NEIGHBOR_MODE, periodic=PERIODIC)
+
+def check_engine(steps=50, seed=0, n=N):
+    """Сверка Flock с объектным путём: max |Δ| за один шаг из общего состояния (по всем шагам)."""
+    global agents
+    saved = agents
+    agents = init_agents(seed, n)
+    err = 0.0
+    for _ in range(steps):
+        fl = make_flock(agents)
+        fl.step()
+        step()
+        ref = make_flock(agents).state
+        err = max(err, float(abs(fl.state - ref).max()))
+    agents = saved
+    return err
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Параллельный шаг Flock по полосам плоскости.
+# Состояние и ускорения лежат в разделяемой памяти (multiprocessing.shared_memory).
+# Плоскость режется по x на полосы с равным числом агентов; каждый процесс пула берёт
+# свою полосу плюс «призрачную» зону шириной RADIUS с обеих сторон (с учётом тора)
+# и считает ускорения только своих агентов. Затем главный процесс одним синхронным
+# шагом применяет их ко всем. Пары соседей и порядок суммирования те же, что в
+# Flock.step, поэтому результат совпадает с последовательным шагом бит в бит.
+
+from multiprocessing import Pool, shared_memory
+import numpy as np
+from flock import Flock
+
+_worker = {}   # состояние процесса пула: разделяемая память и параметры стаи
+
+
+def _init_worker(name, n, kw):
+    """Инициализатор процесса: подключаемся к разделяемой памяти один раз."""
+    shm = shared_memory.SharedMemory(name=name)
+    _worker["shm"] = shm
+    _worker["buf"] = np.ndarray((6, n), dtype=np.float64, buffer=shm.buf)
+    _worker["kw"] = kw
+
+
+def _strip_accelerations(task):
+    """Ускорения агентов полосы k; запись в строки 4–5 разделяемого буфера."""
+    k, edges = task
+    buf, kw = _worker["buf"], _worker["kw"]
+    x = buf[0]
+    W, halo = kw["W"], kw["radius"] * (1 + 1e-9)   # запас на округление mod
+    lo, hi = edges[k], edges[k + 1]
+
+    own = np.searchsorted(edges[1:-1], x, side="right") == k
+    if not kw["periodic"]:
+        local = own | ((x >= lo - halo) & (x <= hi + halo))
+    elif hi - lo + 2 * halo >= W:
+        local = np.ones_like(own)
+    else:
+        local = own | (np.mod(x - (lo - halo), W) <= hi - lo + 2 * halo)
+
+    # индексы по возрастанию: порядок соседей j внутри полосы тот же, что глобально
+    idx = np.flatnonzero(local)
+    sub = Flock(*buf[:4, idx], **kw)
+    ax, ay = sub.accelerations(*sub.pairs())
+    mine = own[idx]
+    buf[4, idx[mine]] = ax[mine]
+    buf[5, idx[mine]] = ay[mine]
+    return int(mine.sum())
+
+
+class ParallelFlock(Flock):
+    """Flock, у которого фаза ускорений считается пулом из workers процессов."""
+
+    def __init__(self, *args, workers=2, **kw):
+        super().__init__(*args, **kw)
+        n = len(self)
+        self.workers = workers
+        # строки 0–3 — x, y, vx, vy; строки 4–5 — ускорения ax, ay
+        self._shm = shared_memory.SharedMemory(create=True, size=6 * n * 8)
+        buf = np.ndarray((6, n), dtype=np.float64, buffer=self._shm.buf)
+        buf[:4] = self.state
+        self.state = buf[:4]
+        self.x, self.y, self.vx, self.vy = self.state
+        self.acc = buf[4:]
+        params = dict(W=self.W, H=self.H, radius=self.radius, sep=self.sep,
+                      max_speed=self.max_speed, wc=self.wc, wa=self.wa, ws=self.ws,
+                      steer_limit=self.steer_limit, mode=self.mode, periodic=self.periodic)
+        self._pool = Pool(workers, _init_worker, (self._shm.name, n, params))
+
+    def strips(self):
+        """Границы полос по x: квантили, чтобы в каждой было поровну агентов."""
+        edges = np.quantile(self.x, np.linspace(0, 1, self.workers + 1))
+        edges[0], edges[-1] = 0.0, self.W
+        return edges
+
+    def step(self):
+        """Ускорения — параллельно по полосам, затем общее применение (как в Flock.step)."""
+        edges = self.strips()
+        self._pool.map(_strip_accelerations, [(k, edges) for k in range(self.workers)])
+        self.apply(*self.acc)
+
+    def close(self):
+        """Останавливает пул и освобождает разделяемую память."""
+        self._pool.close()
+        self._pool.join()
+        self.state = self.state.copy()
+        self.x, self.y, self.vx, self.vy = self.state
+        self.acc = None
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Пакетный (headless) прогон Boids: K шагов движка Flock без Matplotlib,
+# траектория пишется потоком в memory-mapped .npy формы (кадры, 4, N): x, y, vx, vy.
+# Рядом сохраняется <файл>.json с параметрами — для воспроизведения и main.py --replay.
+
+import argparse
+import json
+import sys
+import time
+import numpy as np
+import model
+
+
+def open_trajectory(path, frames, n, dtype=np.float64):
+    """Создаёт .npy-файл (frames, 4, n) и возвращает его memmap для записи кадров."""
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(frames, 4, n))
+
+
+def load_trajectory(path):
+    """Открывает сохранённую траекторию только для чтения (без загрузки в память)."""
+    return np.load(path, mmap_mode="r")
+
+
+def run(steps, n=model.N, seed=0, out=None, every=1, mode=None, dtype=np.float64, **over):
+    """
+    Прогон steps шагов стаи из init_agents(seed, n) с параметрами model.params(**over).
+    Если задан out — каждый every-й кадр (и начальный) пишется в out.
+    Возврат: (flock, секунды на шаги).
+    """
+    p = model.params(**over)
+    flock = model.make_flock(model.init_agents(seed, n, p["W"], p["H"]), mode, **over)
+    traj = None
+    if out:
+        traj = open_trajectory(out, steps // every + 1, n, dtype)
+        traj[0] = flock.state
+        with open(out + ".json", "w", encoding="utf-8") as f:
+            json.dump({"steps": steps, "n": n, "seed": seed, "every": every,
+                       "mode": flock.mode, "periodic": flock.periodic, "params": p}, f, indent=2)
+
+    t0 = time.perf_counter()
+    for k in range(1, steps + 1):
+        flock.step()
+        if traj is not None and k % every == 0:
+            traj[k // every] = flock.state
+    elapsed = time.perf_counter() - t0
+
+    if traj is not None:
+        traj.flush()
+        del traj
+    return flock, elapsed
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Boids: headless-прогон с записью траектории")
+    ap.add_argument("--steps", type=int, default=1000, help="Число шагов модели")
+    ap.add_argument("--n", type=int, default=model.N, help="Число агентов")
+    ap.add_argument("--seed", type=int, default=0, help="Seed начальной стаи")
+    ap.add_argument("--width", type=float, default=model.W, help="Ширина поля")
+    ap.add_argument("--height", type=float, default=model.H, help="Высота поля")
+    ap.add_argument("--mode", choices=["grid", "kdtree", "brute"], default=None, help="Поиск соседей")
+    ap.add_argument("--out", type=str, default=None, help="Файл траектории .npy (без него — только замер)")
+    ap.add_argument("--every", type=int, default=1, help="Сохранять каждый k-й шаг")
+    ap.add_argument("--float32", action="store_true", help="Хранить траекторию в float32 (вдвое меньше)")
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    dtype = np.float32 if args.float32 else np.float64
+    _, elapsed = run(args.steps, args.n, args.seed, args.out, args.every, args.mode, dtype,
+                     W=args.width, H=args.height)
+    print(f"{args.steps} шагов × {args.n} агентов: {elapsed:.2f} с "
+          f"({args.steps / elapsed:.1f} шаг/с); matplotlib загружен: {'matplotlib' in sys.modules}")
+    if args.out:
+        print(f"Траектория: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Пространственный индекс для поиска соседей: равномерная сетка (spatial hash).
+# Плоскость режется на клетки размером не меньше радиуса поиска, поэтому все соседи
+# агента лежат в его клетке и в 8 соседних. Края зациклены так же, как в Agent.apply (% W, % H).
+
+
+class SpatialGrid:
+    def __init__(self, W, H, cell):
+        # число клеток по осям: клетка не меньше cell, иначе 3×3 окна не хватит
+        self.nx = max(1, int(W // cell))
+        self.ny = max(1, int(H // cell))
+        self.cw = W / self.nx
+        self.ch = H / self.ny
+        self.cells = {}
+        # смещения соседних клеток без повторов (при 1–2 клетках по оси wrap даёт дубли)
+        self.dxs = sorted({d % self.nx for d in (-1, 0, 1)})
+        self.dys = sorted({d % self.ny for d in (-1, 0, 1)})
+
+    def cell_of(self, x, y):
+        """Клетка (cx, cy) для точки; % на случай x == W после инициализации."""
+        return int(x // self.cw) % self.nx, int(y // self.ch) % self.ny
+
+    def rebuild(self, agents):
+        """Полная перестройка индекса — один раз за шаг модели, O(N)."""
+        cells = {}
+        for i, a in enumerate(agents):
+            cells.setdefault(self.cell_of(a.x, a.y), []).append(i)
+        self.cells = cells
+
+    def candidates(self, x, y):
+        """Индексы агентов из окна 3×3 клеток вокруг точки (с учётом зацикливания)."""
+        cx, cy = self.cell_of(x, y)
+        res = []
+        for dx in self.dxs:
+            for dy in self.dys:
+                res.extend(self.cells.get(((cx + dx) % self.nx, (cy + dy) % self.ny), ()))
+        return res
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Перебор параметров Boids (WC/WA/WS, RADIUS, SEP, MAX_SPEED × seeds) на нескольких ядрах.
+# Для каждого прогона считаются метрики стаи; результаты кэшируются на диске по хэшу
+# полного набора параметров, поэтому повторный перебор считает только новые точки.
+
+import argparse
+import csv
+import hashlib
+import itertools
+import json
+import os
+from multiprocessing import Pool
+import numpy as np
+import model
+from runner import run
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sweep_cache")
+
+# имя опции CLI → ключ model.params()
+AXES = {"wc": "wc", "wa": "wa", "ws": "ws", "radius": "radius", "sep": "sep", "max_speed": "max_speed"}
+
+
+def flock_metrics(flock):
+    """
+    Метрики стаи:
+      order     — параметр порядка |среднее единичных скоростей| (1 — все летят в одну сторону);
+      clusters  — число связных групп в графе «соседей» (расстояние <= radius);
+      nn_dist   — среднее расстояние до ближайшего соседа (на торе при periodic).
+    """
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    from scipy.spatial import cKDTree
+
+    n = len(flock)
+    s = np.hypot(flock.vx, flock.vy)
+    s[s == 0] = 1.0
+    order = float(np.hypot((flock.vx / s).mean(), (flock.vy / s).mean()))
+
+    ii, jj = flock.pairs()
+    graph = coo_matrix((np.ones(len(ii)), (ii, jj)), shape=(n, n))
+    clusters = int(connected_components(graph, directed=False)[0])
+
+    pos = flock.state[:2].T
+    box = None
+    if flock.periodic:
+        pos = np.where(pos >= (flock.W, flock.H), 0.0, pos)
+        box = (flock.W, flock.H)
+    d, _ = cKDTree(pos, boxsize=box).query(pos, k=2)
+    return {"order": order, "clusters": clusters, "nn_dist": float(d[:, 1].mean())}
+
+
+def expand(seeds=(0,), **axes):
+    """Декартово произведение осей перебора и seeds → список точек (словарей)."""
+    keys = list(axes)
+    points = []
+    for values in itertools.product(*(axes[k] for k in keys)):
+        for seed in seeds:
+            points.append(dict(zip(keys, values), seed=seed))
+    return points
+
+
+def point_key(point, steps, n):
+    """Ключ кэша: хэш всех параметров прогона (включая неизменённые константы модели)."""
+    over = {k: v for k, v in point.items() if k != "seed"}
+    full = {"params": model.params(**over), "seed": point["seed"], "steps": steps, "n": n,
+            "mode": model.NEIGHBOR_MODE, "periodic": model.PERIODIC}
+    return hashlib.sha1(json.dumps(full, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def run_point(task):
+    """Один прогон точки перебора (выполняется в процессе пула)."""
+    point, steps, n = task
+    over = {k: v for k, v in point.items() if k != "seed"}
+    flock, elapsed = run(steps, n, point["seed"], **over)
+    return dict(point, **flock_metrics(flock), seconds=elapsed)
+
+
+def sweep(points, steps=300, n=model.N, workers=None, cache_dir=CACHE_DIR):
+    """
+    Прогоняет все точки, новые — параллельно в пуле процессов.
+    Возврат: список результатов в порядке points и число реально посчитанных точек.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = [os.path.join(cache_dir, point_key(p, steps, n) + ".json") for p in points]
+    results = [None] * len(points)
+    todo = []
+    for k, path in enumerate(paths):
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                results[k] = json.load(f)
+        else:
+            todo.append(k)
+
+    if todo:
+        with Pool(workers) as pool:
+            done = pool.map(run_point, [(points[k], steps, n) for k in todo])
+        for k, res in zip(todo, done):
+            with open(paths[k], "w", encoding="utf-8") as f:
+                json.dump(res, f)
+            results[k] = res
+    return results, len(todo)
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Boids: перебор параметров с кэшем результатов")
+    ap.add_argument("--wc", type=float, nargs="+", default=[model.WC], help="Веса cohesion")
+    ap.add_argument("--wa", type=float, nargs="+", default=[model.WA], help="Веса alignment")
+    ap.add_argument("--ws", type=float, nargs="+", default=[model.WS], help="Веса separation")
+    ap.add_argument("--radius", type=float, nargs="+", default=[model.RADIUS], help="Радиусы соседства")
+    ap.add_argument("--sep", type=float, nargs="+", default=[model.SEP], help="Дистанции разделения")
+    ap.add_argument("--max-speed", type=float, nargs="+", default=[model.MAX_SPEED], help="Макс. скорости")
+    ap.add_argument("--seeds", type=int, nargs="+", default=[0], help="Seeds начальной стаи")
+    ap.add_argument("--steps", type=int, default=300, help="Шагов на прогон")
+    ap.add_argument("--n", type=int, default=model.N, help="Число агентов")
+    ap.add_argument("--workers", type=int, default=None, help="Процессов (по умолчанию — все ядра)")
+    ap.add_argument("--out", type=str, default=None, help="CSV с результатами")
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    axes = {key: getattr(args, opt) for opt, key in AXES.items()}
+    points = expand(args.seeds, **axes)
+    results, computed = sweep(points, args.steps, args.n, args.workers)
+    print(f"Точек: {len(points)}, посчитано заново: {computed}, из кэша: {len(points) - computed}")
+
+    cols = list(AXES.values()) + ["seed", "order", "clusters", "nn_dist"]
+    print(" ".join(f"{c:>9}" for c in cols))
+    for r in results:
+        print(" ".join(f"{r[c]:9.4g}" for c in cols))
+    if args.out:
+        with open(args.out, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=cols + ["seconds"])
+            w.writeheader()
+            w.writerows({c: r[c] for c in cols + ["seconds"]} for r in results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Пакетный Монте-Карло прогон «Жизни»: много seed × плотностей без вывода на экран.
+# Доски живут одним 3-D массивом (B, N, N) и шагают вместе (life_step по стопке);
+# устоявшиеся доски (вымерли или вошли в цикл с периодом <= --max-period) выбывают
+# из пакета. Итог — столбцы в .npz: seed, density, lifetime, transient, period,
+# final_pop и матрица population (B, steps+1) — население по шагам.
+
+import argparse, random
+from multiprocessing import Pool
+import numpy as np
+from game_numpy import NumpyGame, life_step
+from patterns import GLIDER
+
+
+def init_boards(size, pairs, glider=False):
+    """Начальные доски: та же последовательность rng, что у Game для random.Random(seed)."""
+    boards = np.zeros((len(pairs), size, size), dtype=np.uint8)
+    for k, (seed, density) in enumerate(pairs):
+        game = NumpyGame(size, size)
+        rng = random.Random(seed)
+        game.random_init(density, rng)
+        if glider:
+            game.place_pattern_safely(GLIDER, rng)
+        boards[k] = game.g
+    return boards
+
+
+def evolve(boards, steps, max_period=8, seed=0):
+    """
+    Эволюция стопки досок на steps поколений.
+    Возврат: словарь столбцов lifetime, transient, period, final_pop и population.
+    """
+    B, h, w = boards.shape
+    keys = np.random.default_rng(seed).integers(0, 2**64, size=(h, w), dtype=np.uint64)
+    population = np.zeros((B, steps + 1), dtype=np.int32)
+    lifetime = np.full(B, -1, dtype=np.int32)    # поколение вымирания, -1 — дожила
+    transient = np.full(B, -1, dtype=np.int32)   # начало цикла, -1 — цикл не найден
+    period = np.full(B, -1, dtype=np.int32)
+    hist = np.zeros((max_period, B), dtype=np.uint64)   # хэши последних поколений (кольцо)
+
+    idx = np.arange(B)     # доски, которые ещё считаются
+    cur = boards.copy()
+    for t in range(steps + 1):
+        pop = cur.sum(axis=(1, 2), dtype=np.int32)
+        population[idx, t] = pop
+        # хэш Зобриста каждой доски: XOR ключей живых клеток
+        hsh = np.bitwise_xor.reduce(np.where(cur == 1, keys, np.uint64(0)).reshape(len(idx), -1), axis=1)
+
+        done = pop == 0
+        per = np.where(done, 1, 0)
+        for p in range(1, min(t, max_period) + 1):
+            hit = ~done & (hist[(t - p) % max_period] == hsh)
+            per[hit] = p
+            done |= hit
+        if done.any():
+            d = idx[done]
+            lifetime[d[pop[done] == 0]] = t
+            period[d] = per[done]
+            transient[d] = t - per[done] * (pop[done] > 0)
+            # население устоявшихся досок дальше повторяется с их периодом
+            for b, p in zip(d, per[done]):
+                population[b, t + 1:] = np.resize(population[b, t - p + 1:t + 1], steps - t)
+            keep = ~done
+            idx, cur, hist, hsh = idx[keep], cur[keep], hist[:, keep], hsh[keep]
+        if not len(idx):
+            break
+        hist[t % max_period] = hsh
+        if t < steps:
+            cur = life_step(cur)
+
+    return {"lifetime": lifetime, "transient": transient, "period": period,
+            "final_pop": population[:, -1].copy(), "population": population}
+
+
+def _run_chunk(task):
+    """Один кусок пар (seed, density) — для пула процессов."""
+    size, pairs, steps, max_period, glider = task
+    return evolve(init_boards(size, pairs, glider), steps, max_period)
+
+
+def run_batch(size, seeds, densities, steps, max_period=8, glider=False, workers=1, chunk=256):
+    """Все сочетания seeds × densities; куски по chunk досок, при workers > 1 — в пуле процессов."""
+    pairs = [(s, d) for d in densities for s in seeds]
+    tasks = [(size, pairs[i:i + chunk], steps, max_period, glider) for i in range(0, len(pairs), chunk)]
+    if workers > 1:
+        with Pool(workers) as pool:
+            parts = pool.map(_run_chunk, tasks)
+    else:
+        parts = [_run_chunk(t) for t in tasks]
+    cols = {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+    cols["seed"] = np.array([s for s, _ in pairs], dtype=np.int64)
+    cols["density"] = np.array([d for _, d in pairs], dtype=np.float64)
+    return cols
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Lab 4: пакетный Монте-Карло прогон Game of Life")
+    ap.add_argument("--size", type=int, default=40, help="Размер поля N=M")
+    ap.add_argument("--seeds", type=int, default=100, help="Число seed (0..seeds-1) на каждую плотность")
+    ap.add_argument("--densities", type=float, nargs="+", default=[0.2, 0.3, 0.4, 0.5], help="Плотности")
+    ap.add_argument("--steps", type=int, default=1000, help="Максимум поколений")
+    ap.add_argument("--max-period", type=int, default=8, help="Самый длинный ловимый период цикла")
+    ap.add_argument("--glider", action="store_true", help="Добавлять glider, как в main.py")
+    ap.add_argument("--workers", type=int, default=1, help="Процессов в пуле")
+    ap.add_argument("--out", type=str, default="life_batch.npz", help="Файл результатов (.npz, по столбцам)")
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    cols = run_batch(args.size, range(args.seeds), args.densities, args.steps,
+                     args.max_period, args.glider, args.workers)
+    np.savez_compressed(args.out, **cols)
+
+    print(f"{'density':>8} {'вымерло':>8} {'ср.жизнь':>9} {'устоялось':>10} {'ср.transient':>13}")
+    for d in args.densities:
+        m = cols["density"] == d
+        dead = cols["lifetime"][m] >= 0
+        settled = cols["period"][m] > 0
+        life = cols["lifetime"][m][dead].mean() if dead.any() else float("nan")
+        tr = cols["transient"][m][settled].mean() if settled.any() else float("nan")
+        print(f"{d:8.2f} {dead.mean():8.1%} {life:9.1f} {settled.mean():10.1%} {tr:13.1f}")
+    print(f"Результаты: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
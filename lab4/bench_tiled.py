@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# Бенчмарк многопроцессного движка: время поколения TiledGame в зависимости от числа
+# воркеров и размера поля, ускорение относительно NumpyGame и проверка совпадения досок.
+
+import argparse, os, time
+import numpy as np
+from game_numpy import NumpyGame
+from game_tiled import TiledGame
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Бенчмарк TiledGame (полосы + барьер)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 4000], help="Размеры поля N (N×N)")
+    ap.add_argument("--workers", type=int, nargs="+", default=None, help="Числа воркеров (по умолчанию 1..CPU)")
+    ap.add_argument("--steps", type=int, default=20, help="Поколений на замер")
+    ap.add_argument("--density", type=float, default=0.3, help="Плотность случайного поля")
+    return ap.parse_args()
+
+def main():
+    args = parse_args()
+    workers = args.workers or list(range(1, (os.cpu_count() or 1) + 1))
+    print(f"CPU={os.cpu_count()}, поколений на замер={args.steps}")
+    print(f"{'N':>6} {'воркеры':>8} {'мс/пок.':>9} {'ускорение':>10} {'совпадает':>10}")
+    for n in args.sizes:
+        board = (np.random.default_rng(0).random((n, n)) < args.density).astype(np.uint8)
+        ref = NumpyGame(n, n)
+        ref.g = board.copy()
+        t0 = time.perf_counter()
+        for _ in range(args.steps):
+            ref.step()
+        base = time.perf_counter() - t0
+        print(f"{n:6d} {'numpy':>8} {base / args.steps * 1e3:9.2f} {1.0:10.2f} {'—':>10}")
+        for w in workers:
+            with TiledGame(n, n, workers=w) as game:
+                game.g = board
+                t0 = time.perf_counter()
+                game.step_many(args.steps)
+                t = time.perf_counter() - t0
+                same = np.array_equal(game.g, ref.g)
+            print(f"{n:6d} {w:8d} {t / args.steps * 1e3:9.2f} {base / t:10.2f} {str(same):>10}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# Обнаружение вымирания и циклов: хэш Зобриста поля (XOR случайных 64-битных ключей
+# живых клеток) обновляется только по изменившимся клеткам, а хэши последних
+# поколений хранятся в ограниченной таблице. Повтор хэша = цикл: переходный
+# процесс (transient) — поколение первого появления состояния, период — разница поколений.
+# Периоды длиннее history не ловятся; коллизия 64-битных хэшей практически исключена.
+# У HashLife окно H×W — лишь часть бесконечной плоскости, поэтому его состояние
+# хэшируется по квадродереву целиком: структурный хэш узлов (кэшируется по узлу)
+# плюс координаты угла корня, с которого срезаны пустые края.
+
+from collections import OrderedDict
+from typing import Optional, Tuple
+import numpy as np
+
+
+class CycleTracker:
+    def __init__(self, h: int, w: int, history: int = 4096, seed: int = 0):
+        self.keys = np.random.default_rng(seed).integers(0, 2**64, size=(h, w), dtype=np.uint64)
+        self.history = history
+        self.seen: "OrderedDict[int, int]" = OrderedDict()   # хэш → поколение
+        self.hash = 0
+        self.prev = None
+        self.transient: Optional[int] = None
+        self.period: Optional[int] = None
+        self.extinct = False
+        self.node_hash = {}   # узел HashLife → структурный хэш
+        self.gc_runs = 0
+
+    def _node_hash(self, m) -> int:
+        h = self.node_hash.get(m)
+        if h is None:
+            h = m.n if m.k == 0 else hash((m.k, self._node_hash(m.a), self._node_hash(m.b),
+                                           self._node_hash(m.c), self._node_hash(m.d)))
+            self.node_hash[m] = h
+        return h
+
+    def _tree_key(self, game) -> int:
+        """Ключ состояния HashLife: не зависит от размера корня и окна H×W."""
+        if game.gc_runs != self.gc_runs:
+            # после сборки мусора старые узлы не нужны — не держим их в кэше хэшей
+            self.node_hash.clear()
+            self.gc_runs = game.gc_runs
+        root = game.root
+        k, q, top, left = root.k, (root.a, root.b, root.c, root.d), game.top, game.left
+        # пока все живые клетки в центральной половине — переходим к ней
+        while k >= 3:
+            a, b, c, d = q
+            inner = (a.d, b.c, c.b, d.a)
+            if sum(m.n for m in inner) != sum(m.n for m in q):
+                break
+            q = inner
+            top += 1 << (k - 2)
+            left += 1 << (k - 2)
+            k -= 1
+        return hash((k, *(self._node_hash(m) for m in q), top, left))
+
+    def _xor(self, r: np.ndarray, c: np.ndarray) -> int:
+        return int(np.bitwise_xor.reduce(self.keys[r, c])) if len(r) else 0
+
+    def observe(self, gen: int, game) -> Optional[Tuple[int, int]]:
+        """
+        Учитывает поле поколения gen (наблюдать нужно каждое поколение подряд, с 0).
+        Возврат: (transient, period), если состояние уже встречалось, иначе None.
+        """
+        if hasattr(game, "root"):
+            # HashLife: пустым считается вся плоскость, а не окно
+            key, empty = self._tree_key(game), game.population == 0
+        else:
+            board = np.asarray(game.g, dtype=np.uint8)
+            if gen == 0:
+                self.hash = self._xor(*np.nonzero(board))
+                # разреженный движок сам знает изменения шага — копия доски для сравнения не нужна
+                self.prev = None if hasattr(game, "stride") else board.copy()
+            elif self.prev is None:
+                idx = game.changed
+                self.hash ^= self._xor(idx // game.stride - 1, idx % game.stride - 1)
+            else:
+                r, c = np.nonzero(board != self.prev)
+                self.hash ^= self._xor(r, c)
+                self.prev[...] = board
+            key, empty = self.hash, not board.any()
+
+        if empty:
+            # пустое поле — неподвижная точка с периодом 1
+            self.extinct = True
+            self.transient, self.period = gen, 1
+            return self.transient, self.period
+        first = self.seen.get(key)
+        if first is not None:
+            self.transient, self.period = first, gen - first
+            return self.transient, self.period
+        self.seen[key] = gen
+        if len(self.seen) > self.history:
+            self.seen.popitem(last=False)
+        return None
+
+
+def run_until_cycle(game, max_steps: int, history: int = 4096) -> Tuple[int, Optional[int], Optional[int], bool]:
+    """
+    Шаги до max_steps или до обнаружения цикла/вымирания.
+    Возврат: (поколений сделано, transient, period, вымерло).
+    """
+    tracker = CycleTracker(game.H, game.W, history)
+    if tracker.observe(0, game):
+        return 0, tracker.transient, tracker.period, tracker.extinct
+    for gen in range(1, max_steps + 1):
+        game.step()
+        if tracker.observe(gen, game):
+            return gen, tracker.transient, tracker.period, tracker.extinct
+    return max_steps, None, None, False
@@ -0,0 +1,24 @@
+# Выбор реализации поля по имени (опция --engine в main.py)
+
+from game import Game
+
+ENGINES = ("python", "numpy", "sparse", "tiled", "hashlife")
+
+
+def make_game(engine: str, h: int, w: int):
+    """Создаёт пустое поле h×w выбранного движка; интерфейс у всех как у Game."""
+    if engine == "python":
+        return Game(h, w)
+    if engine == "numpy":
+        from game_numpy import NumpyGame   # NumPy нужен только этому движку
+        return NumpyGame(h, w)
+    if engine == "sparse":
+        from game_sparse import SparseGame
+        return SparseGame(h, w)
+    if engine == "tiled":
+        from game_tiled import TiledGame
+        return TiledGame(h, w)
+    if engine == "hashlife":
+        from game_hashlife import HashLifeGame
+        return HashLifeGame(h, w)
+    raise ValueError(f"Неизвестный движок: {engine} (есть: {', '.join(ENGINES)})")
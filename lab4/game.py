@@ -8,6 +8,54 @@ DEAD  = " "   # Мёртвая клетка
 
 Grid = List[List[int]]
 
+def integral_image(grid: Grid) -> Grid:
+    """Таблица сумм (H+1)×(W+1): S[i][j] — число живых в grid[:i][:j]."""
+    h, w = len(grid), len(grid[0])
+    S = [[0]*(w + 1) for _ in range(h + 1)]
+    for i in range(h):
+        acc, row, prev, cur = 0, grid[i], S[i], S[i+1]
+        for j in range(w):
+            acc += 1 if row[j] else 0
+            cur[j+1] = prev[j+1] + acc
+    return S
+
+def window_sums(S: Grid, h: int, w: int) -> Grid:
+    """Число живых в каждом окне h×w по таблице сумм: четыре обращения на окно."""
+    return [[S[x+h][y+w] - S[x][y+w] - S[x+h][y] + S[x][y] for y in range(len(S[0]) - w)]
+            for x in range(len(S) - h)]
+
+def find_windows(grid: Grid, sizes: List[Tuple[int,int]], rng: random.Random, max_live: int = 1) -> List[Tuple[int,int,bool]]:
+    """
+    Окна для паттернов размеров sizes, по очереди. Кандидаты — окна, не задевающие уже
+    выбранные; из них с <=max_live живых берётся одно равновероятно (rng.randrange по
+    списку в порядке строк), а если таких нет — из окон с наименьшим числом живых.
+    Возврат: [(x, y, найдено_пустое_окно)].
+    """
+    H, W = len(grid), len(grid[0])
+    S = integral_image(grid)
+    spots = []
+    for h, w in sizes:
+        if h > H or w > W:
+            raise ValueError(f"паттерн {h}×{w} больше поля {H}×{W}")
+        live = window_sums(S, h, w)
+        ok = [[True]*(W - w + 1) for _ in range(H - h + 1)]
+        for (px, py, _), (ph, pw) in zip(spots, sizes):
+            # окно h×w с углом (x, y) задевает поставленное, если x ∈ (px-h, px+ph), y ∈ (py-w, py+pw)
+            y0, y1 = max(py - w + 1, 0), min(py + pw, W - w + 1)
+            for x in range(max(px - h + 1, 0), min(px + ph, H - h + 1)):
+                ok[x][y0:y1] = [False]*max(y1 - y0, 0)
+        free = [(live[x][y], x, y) for x in range(H - h + 1) for y in range(W - w + 1) if ok[x][y]]
+        if not free:
+            raise ValueError(f"нет места для паттерна {h}×{w} без наложения на уже поставленные")
+        cands = [(x, y) for v, x, y in free if v <= max_live]
+        found = bool(cands)
+        if not found:
+            least = min(v for v, _, _ in free)
+            cands = [(x, y) for v, x, y in free if v == least]
+        x, y = cands[rng.randrange(len(cands))]
+        spots.append((x, y, found))
+    return spots
+
 class Game:
     def __init__(self, h: int, w: int):
         self.H, self.W = h, w
@@ -19,30 +67,22 @@ class Game:
             for j in range(self.W):
                 self.g[i][j] = 1 if rng.random() < p_alive else 0
 
-    def place_pattern_safely(self, pattern: Grid, rng: random.Random, max_tries: int = 200) -> Tuple[int,int,bool]:
+    def place_pattern_safely(self, pattern: Grid, rng: random.Random, max_live: int = 1) -> Tuple[int,int,bool]:
         """
-        Ставим паттерн в «почти пустое» окно (<=1 живой).
-        Если не нашли быстро — ставим в случайное место.
+        Ставим паттерн в «почти пустое» окно (<=max_live живых), выбранное равновероятно
+        среди всех таких окон. Если таких нет — в окно с наименьшим числом живых.
         Возврат: (x, y, найдено_пустое_окно)
         """
-        h, w = len(pattern), len(pattern[0])
-        for tries in range(max_tries + 1):
-            x = rng.randrange(0, self.H - h + 1)
-            y = rng.randrange(0, self.W - w + 1)
-
-            # Считаем живые в окне
-            live = 0
-            for i in range(h):
-                for j in range(w):
-                    live += self.g[x+i][y+j]
+        return self.place_patterns([pattern], rng, max_live)[0]
 
-            # Если окно почти пустое — накладываем; иначе в конце — как есть
-            if live <= 1 or tries == max_tries:
-                for i in range(h):
-                    for j in range(w):
-                        self.g[x+i][y+j] = 1 if (self.g[x+i][y+j] or pattern[i][j]) else 0
-                return x, y, (live <= 1)
-        return 0, 0, False  
+    def place_patterns(self, patterns: List[Grid], rng: random.Random, max_live: int = 1) -> List[Tuple[int,int,bool]]:
+        """Несколько паттернов по очереди, окна не перекрываются (см. find_windows)."""
+        spots = find_windows(self.g, [(len(p), len(p[0])) for p in patterns], rng, max_live)
+        for pattern, (x, y, _) in zip(patterns, spots):
+            for i in range(len(pattern)):
+                for j in range(len(pattern[0])):
+                    self.g[x+i][y+j] = 1 if (self.g[x+i][y+j] or pattern[i][j]) else 0
+        return spots
 
     def _count_neighbors(self, r: int, c: int) -> int:
         """Подсчёт 8 соседей; края не замкнуты (за пределами — 0)."""
@@ -0,0 +1,290 @@
+# HashLife: поле — канонизированное квадродерево, результаты шагов на 2^j поколений
+# мемоизируются по (узел, j). Одинаковые области хранятся один раз, поэтому
+# повторяющиеся и разреженные конфигурации можно продвигать на миллионы поколений.
+#
+# В отличие от Game, плоскость бесконечна: окно H×W задаёт только область
+# random_init/place_pattern_safely/render, а за его краями жизнь продолжается.
+# Кэш узлов ограничен max_nodes: при переполнении (между шагами) таблица и мемо
+# очищаются и заново заполняются только узлами текущего поля.
+
+import random
+from typing import Iterable, List, Tuple
+
+from game import Grid, ALIVE, DEAD, find_windows
+
+
+class Node:
+    """Узел квадродерева уровня k (сторона 2^k): a=nw, b=ne, c=sw, d=se; n — число живых."""
+    __slots__ = ("k", "a", "b", "c", "d", "n")
+
+    def __init__(self, k, a, b, c, d, n):
+        self.k, self.a, self.b, self.c, self.d, self.n = k, a, b, c, d, n
+
+
+OFF = Node(0, None, None, None, None, 0)
+ON = Node(0, None, None, None, None, 1)
+
+
+class HashLifeGame:
+    def __init__(self, h: int, w: int, max_nodes: int = 500_000):
+        self.H, self.W = h, w
+        self.max_nodes = max_nodes
+        self.table = {}        # (a, b, c, d) → канонический узел
+        self.memo = {}         # (узел, j) → центр узла через 2^j поколений
+        self.zeros = [OFF]     # пустые узлы по уровням
+        self.gc_runs = 0
+        self.generation = 0
+        k = 1
+        while (1 << k) < max(h, w):
+            k += 1
+        self.root = self._zero(k)
+        self.top, self.left = 0, 0   # координаты левого верхнего угла root
+
+    # --- канонические узлы ---
+
+    def _join(self, a, b, c, d):
+        key = (a, b, c, d)
+        node = self.table.get(key)
+        if node is None:
+            node = Node(a.k + 1, a, b, c, d, a.n + b.n + c.n + d.n)
+            self.table[key] = node
+        return node
+
+    def _zero(self, k):
+        while len(self.zeros) <= k:
+            z = self.zeros[-1]
+            self.zeros.append(self._join(z, z, z, z))
+        return self.zeros[k]
+
+    def _centre(self, m):
+        """Тот же узел в центре пустого узла уровнем выше."""
+        z = self._zero(m.k - 1)
+        return self._join(self._join(z, z, z, m.a), self._join(z, z, m.b, z),
+                          self._join(z, m.c, z, z), self._join(m.d, z, z, z))
+
+    def _life_4x4(self, m):
+        """Базовый случай: центр 2×2 узла 4×4 через одно поколение."""
+        cells = [[m.a.a.n, m.a.b.n, m.b.a.n, m.b.b.n],
+                 [m.a.c.n, m.a.d.n, m.b.c.n, m.b.d.n],
+                 [m.c.a.n, m.c.b.n, m.d.a.n, m.d.b.n],
+                 [m.c.c.n, m.c.d.n, m.d.c.n, m.d.d.n]]
+        out = []
+        for r in (1, 2):
+            for c in (1, 2):
+                s = sum(cells[r + dr][c + dc] for dr in (-1, 0, 1) for dc in (-1, 0, 1)) - cells[r][c]
+                out.append(ON if s == 3 or (s == 2 and cells[r][c]) else OFF)
+        return self._join(*out)
+
+    def _successor(self, m, j):
+        """Центр узла m (уровень k-1) через 2^j поколений, j <= k-2."""
+        if m.n == 0:
+            return m.a
+        j = min(j, m.k - 2)
+        key = (m, j)
+        s = self.memo.get(key)
+        if s is not None:
+            return s
+        if m.k == 2:
+            s = self._life_4x4(m)
+        else:
+            join, succ = self._join, self._successor
+            a, b, c, d = m.a, m.b, m.c, m.d
+            c1 = succ(join(a.a, a.b, a.c, a.d), j)
+            c2 = succ(join(a.b, b.a, a.d, b.c), j)
+            c3 = succ(join(b.a, b.b, b.c, b.d), j)
+            c4 = succ(join(a.c, a.d, c.a, c.b), j)
+            c5 = succ(join(a.d, b.c, c.b, d.a), j)
+            c6 = succ(join(b.c, b.d, d.a, d.b), j)
+            c7 = succ(join(c.a, c.b, c.c, c.d), j)
+            c8 = succ(join(c.b, d.a, c.d, d.c), j)
+            c9 = succ(join(d.a, d.b, d.c, d.d), j)
+            if j < m.k - 2:
+                # девять подузлов уже продвинуты на 2^j — собираем их центральные части
+                s = join(join(c1.d, c2.c, c4.b, c5.a), join(c2.d, c3.c, c5.b, c6.a),
+                         join(c4.d, c5.c, c7.b, c8.a), join(c5.d, c6.c, c8.b, c9.a))
+            else:
+                # полный шаг 2^(k-2): ещё по 2^(k-3) поколений для четырёх четвертей
+                s = join(succ(join(c1, c2, c4, c5), j), succ(join(c2, c3, c5, c6), j),
+                         succ(join(c4, c5, c7, c8), j), succ(join(c5, c6, c8, c9), j))
+        self.memo[key] = s
+        return s
+
+    # --- корень поля и координаты ---
+
+    def _grow(self):
+        """Расширяет root вдвое, сохраняя содержимое в центре."""
+        half = 1 << (self.root.k - 1)
+        self.root = self._centre(self.root)
+        self.top -= half
+        self.left -= half
+
+    def _padded(self, m):
+        """Все живые клетки m лежат в его центральной половине."""
+        if m.k < 3:
+            return m.n == 0
+        a, b, c, d = m.a, m.b, m.c, m.d
+        inner = a.d.n + b.c.n + c.b.n + d.a.n
+        return inner == m.n
+
+    def _cover(self, r, c):
+        """Расширяет root, пока точка (r, c) не окажется внутри."""
+        while not (self.top <= r < self.top + (1 << self.root.k)
+                   and self.left <= c < self.left + (1 << self.root.k)):
+            self._grow()
+
+    def get_cell(self, r: int, c: int) -> int:
+        """Значение клетки (r, c); вне root — 0."""
+        m, top, left = self.root, self.top, self.left
+        if not (top <= r < top + (1 << m.k) and left <= c < left + (1 << m.k)):
+            return 0
+        while m.k > 0:
+            half = 1 << (m.k - 1)
+            south, east = r >= top + half, c >= left + half
+            m = (m.d if east else m.c) if south else (m.b if east else m.a)
+            top += half if south else 0
+            left += half if east else 0
+        return m.n
+
+    def _set(self, m, r, c, value):
+        """Копия узла m с клеткой (r, c) (координаты внутри m) = value."""
+        if m.k == 0:
+            return ON if value else OFF
+        half = 1 << (m.k - 1)
+        a, b, cc, d = m.a, m.b, m.c, m.d
+        if r < half:
+            if c < half:
+                a = self._set(a, r, c, value)
+            else:
+                b = self._set(b, r, c - half, value)
+        elif c < half:
+            cc = self._set(cc, r - half, c, value)
+        else:
+            d = self._set(d, r - half, c - half, value)
+        return self._join(a, b, cc, d)
+
+    def set_cell(self, r: int, c: int, value: int) -> None:
+        """Устанавливает клетку (r, c) в 0/1 (поле расширяется при необходимости)."""
+        self._cover(r, c)
+        self.root = self._set(self.root, r - self.top, c - self.left, value)
+
+    def _build(self, cells, k, top, left):
+        """Узел уровня k из множества живых клеток (абсолютные координаты)."""
+        if not cells:
+            return self._zero(k)
+        if k == 0:
+            return ON
+        half = 1 << (k - 1)
+        quads = ([], [], [], [])
+        for r, c in cells:
+            quads[(r >= top + half) * 2 + (c >= left + half)].append((r, c))
+        return self._join(self._build(quads[0], k - 1, top, left),
+                          self._build(quads[1], k - 1, top, left + half),
+                          self._build(quads[2], k - 1, top + half, left),
+                          self._build(quads[3], k - 1, top + half, left + half))
+
+    def set_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """Заменяет поле множеством живых клеток (координаты в окне и за его пределами)."""
+        cells = list(cells)
+        self.top = min([0] + [r for r, _ in cells])
+        self.left = min([0] + [c for _, c in cells])
+        span = max([self.H, self.W] + [max(r - self.top, c - self.left) + 1 for r, c in cells])
+        k = 1
+        while (1 << k) < span:
+            k += 1
+        self.root = self._build(cells, k, self.top, self.left)
+
+    def cells(self) -> List[Tuple[int, int]]:
+        """Все живые клетки поля (абсолютные координаты)."""
+        out = []
+        stack = [(self.root, self.top, self.left)]
+        while stack:
+            m, top, left = stack.pop()
+            if m.n == 0:
+                continue
+            if m.k == 0:
+                out.append((top, left))
+                continue
+            half = 1 << (m.k - 1)
+            stack += [(m.a, top, left), (m.b, top, left + half),
+                      (m.c, top + half, left), (m.d, top + half, left + half)]
+        return out
+
+    @property
+    def population(self) -> int:
+        return self.root.n
+
+    @property
+    def g(self) -> Grid:
+        """Окно H×W как обычная сетка Game (для render и сравнения с другими движками)."""
+        grid = [[0]*self.W for _ in range(self.H)]
+        for r, c in self.cells():
+            if 0 <= r < self.H and 0 <= c < self.W:
+                grid[r][c] = 1
+        return grid
+
+    # --- интерфейс Game ---
+
+    def random_init(self, p_alive: float, rng: random.Random) -> None:
+        """Случайное заполнение окна с той же последовательностью rng, что и в Game."""
+        self.set_cells([(i, j) for i in range(self.H) for j in range(self.W) if rng.random() < p_alive])
+
+    def place_pattern_safely(self, pattern: Grid, rng: random.Random, max_live: int = 1) -> Tuple[int,int,bool]:
+        """Как Game.place_pattern_safely (те же вызовы rng и окна)."""
+        return self.place_patterns([pattern], rng, max_live)[0]
+
+    def place_patterns(self, patterns: List[Grid], rng: random.Random, max_live: int = 1) -> List[Tuple[int,int,bool]]:
+        """Как Game.place_patterns; окна ищутся по таблице сумм окна H×W."""
+        spots = find_windows(self.g, [(len(p), len(p[0])) for p in patterns], rng, max_live)
+        for pattern, (x, y, _) in zip(patterns, spots):
+            for i in range(len(pattern)):
+                for j in range(len(pattern[0])):
+                    if pattern[i][j]:
+                        self.set_cell(x + i, y + j, 1)
+        return spots
+
+    def _advance_pow(self, j: int) -> None:
+        """Продвигает поле на 2^j поколений одним вызовом successor."""
+        while self.root.k < j + 2 or not self._padded(self.root):
+            self._grow()
+        self._grow()
+        k = self.root.k
+        self.root = self._successor(self.root, j)
+        self.top += 1 << (k - 2)
+        self.left += 1 << (k - 2)
+        self.generation += 1 << j
+        if len(self.table) > self.max_nodes:
+            self.collect()
+
+    def step_many(self, n: int) -> None:
+        """n поколений: по одному successor на каждый единичный бит n."""
+        j = 0
+        while n:
+            if n & 1:
+                self._advance_pow(j)
+            n >>= 1
+            j += 1
+
+    def step(self) -> None:
+        """Один шаг по правилам Конвея."""
+        self.step_many(1)
+
+    def collect(self) -> None:
+        """Сборка мусора: очищает мемо и оставляет в таблице только узлы текущего поля."""
+        self.memo.clear()
+        self.table = {}
+        self.zeros = [OFF]
+        seen = set()
+        stack = [self.root]
+        while stack:
+            m = stack.pop()
+            if m.k == 0 or id(m) in seen:
+                continue
+            seen.add(id(m))
+            self.table[(m.a, m.b, m.c, m.d)] = m
+            stack += [m.a, m.b, m.c, m.d]
+        self.gc_runs += 1
+
+    def render(self) -> None:
+        """Текстовая «визуализация» окна H×W."""
+        for row in self.g:
+            print("".join(ALIVE if cell else DEAD for cell in row))
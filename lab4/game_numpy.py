@@ -0,0 +1,99 @@
+# Поле на NumPy: доска — массив uint8, соседи считаются суммой 8 сдвинутых копий.
+# Края не замкнуты, как в Game: за пределами поля — мёртвые клетки.
+
+import random
+from typing import List, Tuple
+import numpy as np
+
+from game import Game, Grid, ALIVE, DEAD
+
+
+def halo_counts(p: np.ndarray) -> np.ndarray:
+    """Число живых соседей внутренних клеток блока p с рамкой (halo) в одну клетку."""
+    return (p[..., :-2, :-2] + p[..., :-2, 1:-1] + p[..., :-2, 2:]
+            + p[..., 1:-1, :-2]                  + p[..., 1:-1, 2:]
+            + p[..., 2:, :-2]  + p[..., 2:, 1:-1]  + p[..., 2:, 2:])
+
+
+def neighbor_counts(g: np.ndarray) -> np.ndarray:
+    """Число живых соседей каждой клетки (по двум последним осям, края — нули)."""
+    pad = [(0, 0)] * (g.ndim - 2) + [(1, 1), (1, 1)]
+    return halo_counts(np.pad(g, pad))
+
+
+def apply_rule(g: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """Правила Конвея по доске g и числам соседей n: рождение=3; выживание=2–3."""
+    return ((n == 3) | ((n == 2) & (g == 1))).astype(np.uint8)
+
+
+def life_step(g: np.ndarray) -> np.ndarray:
+    """Один шаг Конвея для доски (или стопки досок) uint8."""
+    return apply_rule(g, neighbor_counts(g))
+
+
+def integral_image(g: np.ndarray) -> np.ndarray:
+    """Таблица сумм (H+1)×(W+1): S[i, j] — число живых в g[:i, :j]."""
+    S = np.zeros((g.shape[0] + 1, g.shape[1] + 1), dtype=np.int64)
+    np.cumsum(g, axis=0, dtype=np.int64, out=S[1:, 1:])
+    np.cumsum(S[1:, 1:], axis=1, out=S[1:, 1:])
+    return S
+
+
+def window_sums(S: np.ndarray, h: int, w: int) -> np.ndarray:
+    """Число живых во всех окнах h×w сразу, (H-h+1)×(W-w+1)."""
+    return S[h:, w:] - S[:-h, w:] - S[h:, :-w] + S[:-h, :-w]
+
+
+def find_windows(g: np.ndarray, sizes, rng: random.Random, max_live: int = 1) -> List[Tuple[int,int,bool]]:
+    """Как game.find_windows: те же кандидаты в том же порядке и те же вызовы rng."""
+    H, W = g.shape
+    S = integral_image(g)
+    spots = []
+    for h, w in sizes:
+        if h > H or w > W:
+            raise ValueError(f"паттерн {h}×{w} больше поля {H}×{W}")
+        live = window_sums(S, h, w)
+        free = np.ones(live.shape, dtype=bool)
+        for (px, py, _), (ph, pw) in zip(spots, sizes):
+            free[max(px - h + 1, 0):px + ph, max(py - w + 1, 0):py + pw] = False
+        if not free.any():
+            raise ValueError(f"нет места для паттерна {h}×{w} без наложения на уже поставленные")
+        cands = np.flatnonzero(free & (live <= max_live))
+        found = len(cands) > 0
+        if not found:
+            cands = np.flatnonzero(free & (live == live[free].min()))
+        x, y = divmod(int(cands[rng.randrange(len(cands))]), live.shape[1])
+        spots.append((x, y, found))
+    return spots
+
+
+class NumpyGame(Game):
+    """Тот же интерфейс, что у Game, но g — массив np.uint8 формы (H, W)."""
+
+    def __init__(self, h: int, w: int):
+        self.H, self.W = h, w
+        self.g = np.zeros((h, w), dtype=np.uint8)
+
+    def random_init(self, p_alive: float, rng: random.Random) -> None:
+        """Случайное заполнение с той же последовательностью rng, что и в Game."""
+        r = np.fromiter((rng.random() for _ in range(self.H * self.W)), float, self.H * self.W)
+        self.g = (r < p_alive).astype(np.uint8).reshape(self.H, self.W)
+
+    def place_patterns(self, patterns: List[Grid], rng: random.Random, max_live: int = 1) -> List[Tuple[int,int,bool]]:
+        """Как Game.place_patterns (те же вызовы rng и окна), поиск окон — массивами."""
+        pats = [np.asarray(p, dtype=np.uint8) for p in patterns]
+        spots = find_windows(self.g, [p.shape for p in pats], rng, max_live)
+        for pat, (x, y, _) in zip(pats, spots):
+            h, w = pat.shape
+            self.g[x:x+h, y:y+w] |= pat
+        return spots
+
+    def step(self) -> None:
+        """Один шаг по правилам Конвея для всей доски сразу."""
+        self.g = life_step(self.g)
+
+    def render(self) -> None:
+        """Текстовая «визуализация» поля."""
+        chars = np.array([DEAD, ALIVE])
+        for row in chars[self.g]:
+            print("".join(row))
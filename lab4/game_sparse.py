@@ -0,0 +1,106 @@
+# Разреженный шаг: пересчитываются только клетки, в окрестности 3×3 которых что-то
+# изменилось на прошлом шаге (множество изменений хранится как плоские индексы
+# доски с нулевой рамкой). Устоявшиеся области — натюрморты и пустота — не трогаются,
+# а мигалки стоят ровно столько, сколько клеток вокруг них.
+# Если активна большая часть поля, шаг делается целиком (как в NumpyGame).
+# Результат совпадает с Game.step; счётчики последнего шага: active_cells,
+# active_tiles (плитки tile×tile, которых коснулся пересчёт) и changed_cells.
+
+import random
+from typing import List, Tuple
+import numpy as np
+
+from game import Grid
+from game_numpy import NumpyGame, halo_counts, apply_rule
+
+DENSE_FRACTION = 0.02   # при большей доле активных клеток полный шаг NumPy быстрее (замер на 2000×2000)
+
+
+class SparseGame(NumpyGame):
+    def __init__(self, h: int, w: int, tile: int = 16):
+        self.tile = tile
+        self.stride = w + 2   # длина строки доски с рамкой
+        # смещения 8 соседей и самой клетки в плоских индексах
+        self.offsets = np.array([dr * self.stride + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1)])
+        inside = np.zeros((h + 2, w + 2), dtype=bool)
+        inside[1:-1, 1:-1] = True
+        self.inside = inside.ravel()
+        self.mark = np.zeros((h + 2) * (w + 2), dtype=bool)   # рабочая битовая карта
+        super().__init__(h, w)
+        self.active_tiles = self.active_cells = self.changed_cells = 0
+
+    @property
+    def g(self) -> np.ndarray:
+        """Поле H×W — view на доску self.p с нулевой рамкой."""
+        return self.p[1:-1, 1:-1]
+
+    @g.setter
+    def g(self, value) -> None:
+        self.p = np.pad(np.asarray(value, dtype=np.uint8), 1)
+        self.flat = self.p.ravel()
+        self.changed = None   # поле заменили целиком — следующий шаг считает всё
+
+    def _unique(self, idx: np.ndarray) -> np.ndarray:
+        """Уникальные плоские индексы по возрастанию (через битовую карту, без сортировки)."""
+        self.mark[idx] = True
+        res = np.flatnonzero(self.mark)
+        self.mark[res] = False
+        return res
+
+    def _mark(self, x: int, y: int, h: int, w: int) -> None:
+        """Добавляет клетки окна в множество изменений (для правок поля вне step)."""
+        if self.changed is None:
+            return
+        r, c = np.mgrid[x + 1:x + 1 + h, y + 1:y + 1 + w]
+        self.changed = self._unique(np.concatenate([self.changed, (r * self.stride + c).ravel()]))
+
+    def place_patterns(self, patterns: List[Grid], rng: random.Random, max_live: int = 1) -> List[Tuple[int,int,bool]]:
+        """Как у NumpyGame; клетки под паттернами считаются изменёнными."""
+        spots = super().place_patterns(patterns, rng, max_live)
+        for pattern, (x, y, _) in zip(patterns, spots):
+            self._mark(x, y, len(pattern), len(pattern[0]))
+        return spots
+
+    def _tiles(self, idx: np.ndarray) -> int:
+        """Сколько плиток tile×tile содержат клетки из idx."""
+        r, c = idx // self.stride - 1, idx % self.stride - 1
+        th, tw = -(-self.H // self.tile), -(-self.W // self.tile)
+        return int(np.count_nonzero(np.bincount((r // self.tile) * tw + c // self.tile, minlength=th * tw)))
+
+    def step(self) -> None:
+        """Шаг Конвея только для клеток возле изменений прошлого шага."""
+        if self.changed is None:
+            active = None
+        else:
+            # кандидаты: изменившиеся клетки и их соседи, без рамки
+            cand = self._unique((self.changed[:, None] + self.offsets).ravel())
+            active = cand[self.inside[cand]]
+        if active is None or len(active) > DENSE_FRACTION * self.H * self.W:
+            self._step_dense()
+            return
+
+        f = self.flat
+        counts = np.zeros(len(active), dtype=np.uint8)
+        for off in self.offsets:
+            if off:
+                counts += f[active + off]
+        old = f[active]
+        new = apply_rule(old, counts)
+        moved = new != old
+        # запись после расчёта всех активных клеток: соседи читали старое состояние
+        self.changed = active[moved]
+        f[self.changed] = new[moved]
+        self.active_cells = len(active)
+        self.active_tiles = self._tiles(active)
+        self.changed_cells = len(self.changed)
+
+    def _step_dense(self) -> None:
+        """Активно почти всё поле: обычный шаг целиком, изменения — по сравнению досок."""
+        old = self.p[1:-1, 1:-1]
+        new = apply_rule(old, halo_counts(self.p))
+        r, c = np.nonzero(new != old)
+        old[...] = new
+        self.changed = (r + 1) * self.stride + (c + 1)
+        self.active_cells = self.H * self.W
+        self.active_tiles = -(-self.H // self.tile) * -(-self.W // self.tile)
+        self.changed_cells = len(self.changed)
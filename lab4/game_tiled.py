@@ -0,0 +1,100 @@
+# Многопроцессный шаг по горизонтальным полосам.
+# Две доски с нулевой рамкой (текущая и следующая) лежат в разделяемой памяти;
+# каждый процесс-воркер считает свою полосу строк, читая по одной строке halo
+# сверху и снизу прямо из соседних полос, и пишет результат в следующую доску.
+# Поколения синхронизируются барьером, после чего доски меняются ролями.
+# Результат совпадает с Game.step (края не замкнуты).
+
+import os
+from multiprocessing import Barrier, Process, RawArray, shared_memory
+import numpy as np
+
+from game_numpy import NumpyGame, halo_counts, apply_rule
+
+STOP = -1   # команда воркерам вместо числа поколений
+
+
+def _boards(shm, h, w):
+    """Две доски (h+2)×(w+2) поверх буфера разделяемой памяти."""
+    return np.ndarray((2, h + 2, w + 2), dtype=np.uint8, buffer=shm.buf)
+
+
+def _band_worker(name, h, w, r0, r1, ctrl, start, gen):
+    """Воркер полосы строк [r0, r1): ждёт команду, считает n поколений, снова ждёт."""
+    shm = shared_memory.SharedMemory(name=name)
+    boards = _boards(shm, h, w)
+    while True:
+        start.wait()                 # команда от главного процесса
+        n, cur = ctrl[0], ctrl[1]
+        if n == STOP:
+            break
+        for _ in range(n):
+            src, dst = boards[cur], boards[1 - cur]
+            block = src[r0:r1 + 2]   # полоса + по строке halo сверху и снизу
+            dst[r0 + 1:r1 + 1, 1:-1] = apply_rule(block[1:-1, 1:-1], halo_counts(block))
+            gen.wait()               # все полосы дописали поколение
+            cur = 1 - cur
+        start.wait()                 # сообщаем главному процессу об окончании
+    del boards
+    shm.close()
+
+
+class TiledGame(NumpyGame):
+    def __init__(self, h: int, w: int, workers: int = 0):
+        self.workers = max(1, min(workers or os.cpu_count() or 1, h))
+        self._shm = shared_memory.SharedMemory(create=True, size=2 * (h + 2) * (w + 2))
+        self.boards = _boards(self._shm, h, w)
+        self.boards[:] = 0
+        self.ctrl = RawArray("q", 2)   # [число поколений или STOP, индекс текущей доски]
+        super().__init__(h, w)
+
+        start, gen = Barrier(self.workers + 1), Barrier(self.workers)
+        self._start = start
+        edges = np.linspace(0, h, self.workers + 1).astype(int)
+        self._procs = [Process(target=_band_worker, daemon=True,
+                               args=(self._shm.name, h, w, edges[k], edges[k + 1], self.ctrl, start, gen))
+                       for k in range(self.workers)]
+        for p in self._procs:
+            p.start()
+
+    @property
+    def g(self) -> np.ndarray:
+        """Поле H×W — view на текущую доску в разделяемой памяти."""
+        return self.boards[self.ctrl[1], 1:-1, 1:-1]
+
+    @g.setter
+    def g(self, value) -> None:
+        self.boards[self.ctrl[1], 1:-1, 1:-1] = value
+
+    def step_many(self, n: int) -> None:
+        """n поколений подряд; главный процесс ждёт только начала и конца."""
+        if n <= 0:
+            return
+        if not self._procs:
+            raise RuntimeError("TiledGame уже закрыт (close)")
+        self.ctrl[0] = n
+        self._start.wait()
+        self._start.wait()
+        self.ctrl[1] = (self.ctrl[1] + n) % 2
+
+    def step(self) -> None:
+        """Один шаг по правилам Конвея всеми воркерами."""
+        self.step_many(1)
+
+    def close(self) -> None:
+        """Останавливает воркеры и освобождает разделяемую память."""
+        if self._procs:
+            self.ctrl[0] = STOP
+            self._start.wait()
+            for p in self._procs:
+                p.join()
+            self._procs = []
+            self.boards = self.boards.copy()   # поле остаётся доступным после закрытия
+            self._shm.close()
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
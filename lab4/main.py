@@ -2,9 +2,12 @@
 # Точка входа: парсим аргументы, готовим игру, запускаем симуляцию
 
 import argparse, random, time
-from utils import seed_from_student, random_density, clear_console
-from game import Game
+from utils import seed_from_student, random_density
+from render import make_renderer
+from cycles import CycleTracker
+from engines import ENGINES, make_game
 from patterns import GLIDER
+from snapshot import load_board, load_packed, save_packed, set_board
 
 def parse_args():
     ap = argparse.ArgumentParser(description="Lab 4: Game of Life (console, split files)")
@@ -13,6 +16,20 @@ def parse_args():
     ap.add_argument("--student", type=str, default="student", help="Строка для уникального seed (ФИО/группа)")
     ap.add_argument("--steps", type=int, default=300, help="Сколько шагов показать")
     ap.add_argument("--delay", type=float, default=0.06, help="Пауза между кадрами (сек.)")
+    ap.add_argument("--engine", choices=ENGINES, default="python", help="Реализация поля (numpy — для больших досок)")
+    ap.add_argument("--render", choices=["diff", "half", "plain"], default="diff",
+                    help="diff — только изменения через ANSI, half — две строки в символе, plain — очистка и полный вывод")
+    ap.add_argument("--realtime", action="store_true",
+                    help="Считать без пауз и показывать кадр не чаще раза в --delay (промежуточные пропускаются)")
+    ap.add_argument("--on-cycle", choices=["ignore", "stop", "ffwd"], default="ignore",
+                    help="При вымирании/цикле: ignore — считать дальше, stop — остановиться, "
+                         "ffwd — перемотать к последнему шагу по периоду")
+    ap.add_argument("--pattern", type=str, default=None, help="Паттерн из файла (.rle или снимок) вместо glider")
+    ap.add_argument("--checkpoint", type=str, default=None,
+                    help="Файл снимка: пишется каждые --checkpoint-every поколений и при выходе")
+    ap.add_argument("--checkpoint-every", type=int, default=100, help="Период контрольных точек (поколений)")
+    ap.add_argument("--resume", type=str, default=None,
+                    help="Продолжить со снимка (поле и номер поколения берутся из файла)")
     return ap.parse_args()
 
 def main():
@@ -23,18 +40,62 @@ def main():
     # Плотность в требуемом диапазоне
     p_alive = args.density if args.density is not None else random_density(rng)
 
-    N = args.size
-    game = Game(N, N)                       # Поле N×N (40×40)
-    game.random_init(p_alive, rng)          # Случайная начальная сетка
-    gx, gy, free = game.place_pattern_safely(GLIDER, rng)  # Добавляем glider
+    start = 0
+    if args.resume:
+        board, start = load_packed(args.resume)
+        H, W = board.shape
+        game = make_game(args.engine, H, W)
+        set_board(game, board)
+        title = f"Game of Life | size={H}x{W} | resumed {args.resume}@{start}"
+    else:
+        H = W = args.size
+        game = make_game(args.engine, H, W)     # Поле N×N (40×40)
+        game.random_init(p_alive, rng)          # Случайная начальная сетка
+        pattern = load_board(args.pattern) if args.pattern else GLIDER
+        gx, gy, free = game.place_pattern_safely(pattern, rng)  # Добавляем glider (или паттерн из файла)
+        title = f"Game of Life | size={H}x{W} | density≈{p_alive:.2f} | glider@({gx},{gy}) free={free}"
 
-    title = f"Game of Life | size={N}x{N} | density≈{p_alive:.2f} | glider@({gx},{gy}) free={free}"
-    for step in range(args.steps):
-        clear_console()                     # Очистка экрана
-        print(f"{title} | step {step}")     # Номер шага 
-        game.render()                       # Печатаем поле
-        time.sleep(args.delay)              # Задержка для анимации
-        game.step()                         # Применяем правила Конвея
+    renderer = make_renderer(args.render)
+    tracker = CycleTracker(H, W) if args.on_cycle != "ignore" else None
+    found = None
+    next_frame = 0.0
+    gen = start     # поколение, в котором сейчас поле (для контрольной точки)
+    try:
+        for step in range(start, args.steps):
+            now = time.perf_counter()
+            if tracker is not None and found is None:
+                found = tracker.observe(step - start, game)   # трекер считает поколения с начала прогона
+                if found and args.on_cycle == "ffwd":
+                    # состояние повторяется с периодом p — досчитываем только остаток
+                    for _ in range((args.steps - 1 - step) % tracker.period):
+                        game.step()
+                    step = gen = args.steps - 1
+            if not args.realtime or now >= next_frame or step == args.steps - 1 or found:
+                stats = ""
+                if hasattr(game, "active_cells"):   # счётчики разреженного движка (--engine sparse)
+                    stats = f" | active cells={game.active_cells} tiles={game.active_tiles} changed={game.changed_cells}"
+                if found:
+                    stats += f" | transient={start + tracker.transient} period={tracker.period}"
+                renderer.draw(game, f"{title} | step {step}{stats}")   # Кадр с номером шага
+                if found:
+                    break
+                next_frame = now + args.delay
+                if not args.realtime:
+                    # Задержка для анимации (минус время, ушедшее на вывод)
+                    time.sleep(max(0.0, next_frame - time.perf_counter()))
+            game.step()                     # Применяем правила Конвея
+            gen = step + 1
+            if args.checkpoint and gen % args.checkpoint_every == 0:
+                save_packed(args.checkpoint, game.g, gen)
+    finally:
+        renderer.close()
+        if args.checkpoint:
+            save_packed(args.checkpoint, game.g, gen)   # последнее поколение — и при Ctrl+C
+        if hasattr(game, "close"):          # процессы движка tiled
+            game.close()
+    if found:
+        kind = "вымирание" if tracker.extinct else ("неподвижная точка" if tracker.period == 1 else "цикл")
+        print(f"{kind}: transient={start + tracker.transient}, period={tracker.period}")
 
 if __name__ == "__main__":
     main()
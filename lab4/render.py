@@ -0,0 +1,91 @@
+# Отрисовка поля в терминале.
+# PlainRenderer — как раньше: очистка экрана и полная перерисовка.
+# DiffRenderer — выводит только изменившиеся клетки через ANSI-перемещения курсора,
+# весь кадр собирается в одну строку и пишется одним write; в режиме half
+# две строки поля выводятся одним символом (полублоки ▀ ▄ █).
+
+import os
+import sys
+from typing import List
+
+from game import ALIVE, DEAD
+from utils import clear_console
+
+HALF = {(0, 0): " ", (1, 0): "▀", (0, 1): "▄", (1, 1): "█"}
+GAP = 4   # изменения в строке ближе GAP символов пишем одним куском, без нового перемещения
+
+
+class PlainRenderer:
+    """Очистка консоли + заголовок + game.render() на каждый кадр."""
+
+    def draw(self, game, header: str) -> None:
+        clear_console()
+        print(header)
+        game.render()
+
+    def close(self) -> None:
+        pass
+
+
+class DiffRenderer:
+    def __init__(self, half: bool = False, out=sys.stdout):
+        self.half = half
+        self.out = out
+        self.prev: List[str] = []   # строки символов, уже выведенные на экран
+        if os.name == "nt":
+            os.system("")   # включает обработку ANSI-последовательностей в консоли Windows
+
+    def _lines(self, grid) -> List[str]:
+        """Поле → строки символов (в режиме half — по две строки поля на одну)."""
+        if not self.half:
+            return ["".join(ALIVE if c else DEAD for c in row) for row in grid]
+        rows = [list(row) for row in grid]
+        if len(rows) % 2:
+            rows.append([0] * len(rows[0]))
+        return ["".join(HALF[(1 if a else 0, 1 if b else 0)] for a, b in zip(top, bottom))
+                for top, bottom in zip(rows[::2], rows[1::2])]
+
+    def draw(self, game, header: str) -> None:
+        """Кадр: заголовок в 1-й строке, поле со 2-й; выводятся только отличия от прошлого кадра."""
+        lines = self._lines(game.g)
+        buf = []
+        if len(lines) != len(self.prev) or any(len(a) != len(b) for a, b in zip(lines, self.prev)):
+            # первый кадр или сменился размер — полная перерисовка
+            buf.append("\x1b[?25l\x1b[2J")
+            self.prev = [""] * len(lines)
+            for r, line in enumerate(lines):
+                buf.append(f"\x1b[{r + 2};1H{line}")
+        else:
+            for r, (line, old) in enumerate(zip(lines, self.prev)):
+                if line == old:
+                    continue
+                c = 0
+                n = len(line)
+                while c < n:
+                    if line[c] == old[c]:
+                        c += 1
+                        continue
+                    # кусок изменений: тянем, пока отличия идут с разрывами меньше GAP
+                    end, same = c + 1, 0
+                    while end < n and same < GAP:
+                        same = same + 1 if line[end] == old[end] else 0
+                        end += 1
+                    end -= same
+                    buf.append(f"\x1b[{r + 2};{c + 1}H{line[c:end]}")
+                    c = end
+        buf.append(f"\x1b[1;1H\x1b[2K{header}")
+        self.out.write("".join(buf))
+        self.out.flush()
+        self.prev = lines
+
+    def close(self) -> None:
+        """Курсор под поле и снова видим."""
+        self.out.write(f"\x1b[{len(self.prev) + 2};1H\x1b[?25h")
+        self.out.flush()
+
+
+def make_renderer(name: str):
+    """Отрисовщик по имени опции --render."""
+    if name == "plain":
+        return PlainRenderer()
+    return DiffRenderer(half=(name == "half"))
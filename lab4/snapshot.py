@@ -0,0 +1,137 @@
+# Сохранение и загрузка досок.
+# RLE — стандартный текстовый формат паттернов «Жизни» (x = W, y = H, b — мёртвая, o — живая,
+# $ — конец строки, ! — конец). Бинарный формат — заголовок + доска, упакованная по 8 клеток
+# в байт построчно (np.packbits); строки выровнены по байту, поэтому большие доски можно
+# открывать через memmap и распаковывать по кускам. Контрольные точки пишутся атомарно.
+
+import os
+import struct
+from itertools import groupby
+from typing import Tuple
+import numpy as np
+
+from game import Grid
+
+MAGIC = b"LIFEPK01"
+HEADER = struct.Struct("<8sIIQ")   # сигнатура, H, W, поколение
+
+
+def to_rle(grid: Grid) -> str:
+    """Доска или паттерн → текст RLE (строки не длиннее 70 символов)."""
+    h, w = len(grid), len(grid[0]) if len(grid) else 0
+    tokens = []
+    ends = 0   # отложенные концы строк: подряд идущие пишутся одним «n$» перед следующей непустой
+    for row in grid:
+        runs = [(1 if v else 0, len(list(g))) for v, g in groupby(row)]
+        if runs and runs[-1][0] == 0:
+            runs.pop()   # хвост мёртвых клеток в RLE не пишется
+        if runs and ends:
+            tokens.append(f"{ends if ends > 1 else ''}$")
+            ends = 0
+        ends += 1
+        for v, n in runs:
+            tokens.append(f"{n if n > 1 else ''}{'o' if v else 'b'}")
+    tokens.append("!")
+
+    lines, line = [f"x = {w}, y = {h}, rule = B3/S23"], ""
+    for t in tokens:
+        if len(line) + len(t) > 70:
+            lines.append(line)
+            line = ""
+        line += t
+    lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def from_rle(text: str) -> Grid:
+    """Текст RLE → доска (список списков 0/1) размером из заголовка x/y."""
+    body, w, h = [], 0, 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("x"):
+            fields = dict(f.split("=") for f in line.replace(" ", "").split(",") if "=" in f)
+            w, h = int(fields["x"]), int(fields["y"])
+            continue
+        body.append(line)
+
+    grid = [[0]*w for _ in range(h)]
+    r = c = 0
+    num = ""
+    for ch in "".join(body):
+        if ch.isdigit():
+            num += ch
+            continue
+        n = int(num) if num else 1
+        num = ""
+        if ch == "!":
+            break
+        if ch == "$":
+            r += n
+            c = 0
+        elif ch in "bo":
+            if ch == "o":
+                for j in range(c, c + n):
+                    grid[r][j] = 1
+            c += n
+    return grid
+
+
+def save_rle(path: str, grid: Grid) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(to_rle(grid))
+
+
+def load_rle(path: str) -> Grid:
+    with open(path, encoding="utf-8") as f:
+        return from_rle(f.read())
+
+
+def save_packed(path: str, grid, generation: int = 0) -> None:
+    """Бинарный снимок: заголовок + построчно упакованные биты. Запись атомарная (tmp → replace)."""
+    board = np.asarray(grid, dtype=np.uint8)
+    h, w = board.shape
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, h, w, generation))
+        f.write(np.packbits(board, axis=1).tobytes())
+    os.replace(tmp, path)
+
+
+def open_packed(path: str) -> Tuple[np.memmap, int, int, int]:
+    """Снимок через memmap без чтения в память: (упакованные строки H×ceil(W/8), H, W, поколение)."""
+    with open(path, "rb") as f:
+        magic, h, w, generation = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{path}: не снимок доски (сигнатура {magic!r})")
+    packed = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER.size, shape=(h, (w + 7) // 8))
+    return packed, h, w, generation
+
+
+def unpack_rows(packed: np.ndarray, w: int, r0: int = 0, r1: int = None) -> np.ndarray:
+    """Строки [r0, r1) упакованной доски → массив uint8 (r1-r0, w)."""
+    return np.unpackbits(packed[r0:r1], axis=1, count=w)
+
+
+def load_packed(path: str) -> Tuple[np.ndarray, int]:
+    """Снимок целиком: (доска uint8 H×W, поколение)."""
+    packed, h, w, generation = open_packed(path)
+    return unpack_rows(packed, w), generation
+
+
+def set_board(game, board: np.ndarray) -> None:
+    """Загружает доску в игру любого движка (список списков, NumPy или HashLife)."""
+    if hasattr(game, "set_cells"):
+        game.set_cells(map(tuple, np.argwhere(board).tolist()))
+    elif isinstance(game.g, list):
+        game.g = board.tolist()
+    else:
+        game.g = board
+
+
+def load_board(path: str) -> Grid:
+    """Доска или паттерн из файла: .rle — текст RLE, иначе бинарный снимок."""
+    if path.endswith(".rle"):
+        return load_rle(path)
+    return load_packed(path)[0].tolist()
@@ -0,0 +1,286 @@
+# fuzzy_engine.py
+# Универсальный движок нечёткого вывода (без Streamlit).
+# Переменные, термы и правила задаются декларативно, а при создании системы
+# компилируются в плотные массивы индексов: вывод для N точек — несколько
+# векторных операций NumPy. Операторы выбираются параметрами:
+#   and_op — И в посылках правила: "min" или "prod";
+#   imp_op — импликация (Мамдани): "min" (обрезание) или "prod" (масштаб);
+#   agg_op — агрегация выходов (Мамдани): "max" или "probsum" (a + b - a·b).
+# Выход Мамдани — Variable, дефаззификация центроидом; выход Сугено — словарь
+# терм → константа или коэффициенты (c_1, ..., c_n, c_0) линейной функции входов.
+
+import json
+
+import numpy as np
+
+CHUNK = 8192   # точек на кусок: агрегат куска — CHUNK × resolution float64
+
+
+# Функция треугольной принадлежности (как в исходной ЛР):
+# возвращает число от 0 до 1 — насколько x принадлежит терму (a, b, c).
+def tri(x, a, b, c):
+    x = np.asarray(x, float)
+    left = (x - a) / (b - a + 1e-9)
+    right = (c - x) / (c - b + 1e-9)
+    y = np.minimum(left, right)
+    y = np.where((x < a) | (x > c), 0, y)
+    y = np.where(x == b, 1.0, y)
+    return np.clip(y, 0, 1)
+
+
+# Контур терма: вершины (a, b, c) — треугольник, (a, b, c, d) — трапеция, µ = 0 на краях
+# и 1 внутри. Совпадающие вершины (a = b или c = d) остаются парой — вертикальной стороной.
+def outline(points):
+    xs = np.array(points, float)
+    fs = np.ones(len(xs))
+    fs[0] = fs[-1] = 0.0
+    return xs, fs
+
+
+# Терм как ломаная для np.interp: у вертикальной стороны остаётся верхняя точка,
+# то есть совпадающие вершины дают «плечо» (µ = 1 на краю), вне [a, d] µ = 0.
+def polyline(points):
+    xs, fs = outline(points)
+    if xs[0] == xs[1]:
+        xs, fs = xs[1:], fs[1:]
+    if xs[-1] == xs[-2]:
+        xs, fs = xs[:-1], fs[:-1]
+    return xs, fs
+
+
+# Предел µ контура (xs, fs) слева (side="left") или справа ("right") в точках x:
+# на вертикальной стороне они различаются, вне контура оба равны 0.
+def one_sided(x, xs, fs, side):
+    i = np.clip(np.searchsorted(xs, x, side), 1, len(xs) - 1)
+    x0, x1, f0, f1 = xs[i - 1], xs[i], fs[i - 1], fs[i]
+    # вырожденный отрезок попадается только на вертикальной стороне: слева — нижний
+    # конец (начало контура), справа — тоже нижний (конец контура)
+    t = np.where(x1 > x0, (x - x0) / np.where(x1 > x0, x1 - x0, 1), 0.0 if side == "left" else 1.0)
+    return np.where((x < xs[0]) | (x > xs[-1]), 0.0, f0 + (f1 - f0) * np.clip(t, 0.0, 1.0))
+
+
+class Variable:
+    # terms: {имя терма: вершины}, lo..hi — универсум переменной
+    def __init__(self, name, terms, lo=0.0, hi=100.0):
+        self.name = name
+        self.terms = dict(terms)
+        self.labels = list(self.terms)
+        self.lo, self.hi = lo, hi
+        self.lines = [polyline(self.terms[k]) for k in self.labels]
+        self.outlines = [outline(self.terms[k]) for k in self.labels]
+
+    # µ одного терма на массиве x (для графиков)
+    def curve(self, term, x):
+        xs, fs = self.lines[self.labels.index(term)]
+        return np.interp(x, xs, fs, left=0.0, right=0.0)
+
+    # Фаззификация: x любой формы → (..., число термов)
+    def membership(self, x):
+        x = np.asarray(x, float)
+        return np.stack([np.interp(x, xs, fs, left=0.0, right=0.0) for xs, fs in self.lines], axis=-1)
+
+
+# Выход Сугено нулевого порядка из выхода Мамдани: каждый терм → центр тяжести его фигуры.
+def sugeno_outputs(var):
+    out = {}
+    for k, (xs, fs) in zip(var.labels, var.outlines):
+        # по контуру: вертикальные стороны — отрезки нулевой ширины, площади не дают
+        ys = np.concatenate([[var.lo], xs, [var.hi]])
+        gs = np.concatenate([[0.0], fs, [0.0]])
+        dy = np.diff(ys)
+        area = (dy * (gs[:-1] + gs[1:])).sum() / 2
+        moment = (dy * (gs[:-1] * (2 * ys[:-1] + ys[1:]) + gs[1:] * (ys[:-1] + 2 * ys[1:]))).sum() / 6
+        out[k] = moment / area
+    return out
+
+
+def _centroid_segments(ys, f, f_right=None):
+    # Центроид ломаной (ys, f) по последней оси: трапеции точно; пустая фигура → 0.
+    # При скачках f — пределы слева, f_right — справа (отрезок идёт от f_right[i] к f[i + 1]).
+    f_right = f if f_right is None else f_right
+    y0, y1, g0, g1 = ys[..., :-1], ys[..., 1:], f_right[..., :-1], f[..., 1:]
+    dy = y1 - y0
+    area = (dy * (g0 + g1)).sum(axis=-1) / 2
+    moment = (dy * (g0 * (2 * y0 + y1) + g1 * (y0 + 2 * y1))).sum(axis=-1) / 6
+    return np.where(area > 1e-12, moment / np.where(area > 1e-12, area, 1), 0.0)
+
+
+class FuzzySystem:
+    # rules: [((терм входа 1, ..., терм входа n), терм выхода)]; терм входа None — «любой»
+    def __init__(self, inputs, output, rules, and_op="min", imp_op="min", agg_op="max", resolution=501):
+        if and_op not in ("min", "prod") or imp_op not in ("min", "prod") or agg_op not in ("max", "probsum"):
+            raise ValueError(f"неизвестный оператор: and={and_op}, imp={imp_op}, agg={agg_op}")
+        self.inputs = list(inputs)
+        self.output = output
+        self.rules = [(tuple(ante), out) for ante, out in rules]
+        self.and_op, self.imp_op, self.agg_op = and_op, imp_op, agg_op
+        self.kind = "mamdani" if isinstance(output, Variable) else "sugeno"
+
+        # Посылки: номер терма каждого входа; «любой» → дополнительный столбец µ = 1
+        self.rule_in = np.array([[v.labels.index(t) if t is not None else len(v.labels)
+                                  for v, t in zip(self.inputs, ante)] for ante, _ in self.rules])
+        if self.kind == "mamdani":
+            self.rule_out = np.array([output.labels.index(out) for _, out in self.rules])
+            self.out_mask = self.rule_out[None, :] == np.arange(len(output.labels))[:, None]   # (термы, правила)
+            self._compile_mamdani(resolution)
+        else:
+            # z_r = c_0 + Σ c_i·x_i; константа — это c_i = 0
+            n = len(self.inputs)
+            coef = []
+            for _, out in self.rules:
+                c = np.atleast_1d(np.asarray(output[out], float))
+                coef.append(np.concatenate([np.zeros(n), c]) if len(c) == 1 else c)
+            self.coef = np.array(coef)   # (правила, n + 1)
+
+    def _compile_mamdani(self, resolution):
+        out = self.output
+        self.y = np.linspace(out.lo, out.hi, resolution)
+        self.out_mf = np.stack([out.curve(k, self.y) for k in out.labels])   # (термы, resolution)
+        dy = np.diff(self.y)
+        self.trapz_w = np.zeros_like(self.y)     # trapz(f, y) == trapz_w @ f
+        self.trapz_w[:-1] += dy / 2
+        self.trapz_w[1:] += dy / 2
+
+        # Для точного центроида (imp=min, agg=max): агрегат кусочно-линеен, его изломы —
+        # вершины термов, пересечения сторон разных термов (от входа не зависят)
+        # и точки, где сторона терма достигает уровня обрезания какого-либо терма.
+        edges, owner = [], []
+        for k, (xs, fs) in enumerate(out.lines):
+            for i in range(len(xs) - 1):
+                if fs[i] != fs[i + 1]:
+                    edges.append((xs[i], xs[i + 1], fs[i], fs[i + 1]))
+                    owner.append(k)
+        self.edges = np.array(edges).reshape(-1, 4)
+        pts = [out.lo, out.hi] + [x for xs, _ in out.lines for x in xs]
+        for i, (x0, x1, f0, f1) in enumerate(self.edges):
+            for j, (u0, u1, g0, g1) in enumerate(self.edges[:i]):
+                s, r = (f1 - f0) / (x1 - x0), (g1 - g0) / (u1 - u0)
+                if owner[i] != owner[j] and s != r:
+                    x = (g0 - r * u0 - f0 + s * x0) / (s - r)
+                    if max(x0, u0) <= x <= min(x1, u1):
+                        pts.append(x)
+        self.fixed_breaks = np.unique(np.clip(pts, out.lo, out.hi))
+
+    # Силы срабатывания: n массивов входов одной формы → (..., число правил)
+    def strengths(self, *xs):
+        alpha = None
+        for i, (v, x) in enumerate(zip(self.inputs, xs)):
+            mu = v.membership(x)
+            mu = np.concatenate([mu, np.ones(mu.shape[:-1] + (1,))], axis=-1)[..., self.rule_in[:, i]]
+            if alpha is None:
+                alpha = mu
+            elif self.and_op == "min":
+                alpha = np.minimum(alpha, mu, out=alpha)
+            else:
+                alpha = np.multiply(alpha, mu, out=alpha)
+        return alpha
+
+    # Уровни выходных термов: max сил правил с этим термом → (..., число термов)
+    def levels(self, alpha):
+        return np.where(self.out_mask, alpha[..., None, :], 0.0).max(axis=-1)
+
+    def _implied(self, a, k):
+        a = a[..., None]
+        return np.minimum(a, self.out_mf[k]) if self.imp_op == "min" else a * self.out_mf[k]
+
+    # Агрегированная выходная функция на сетке self.y → (..., resolution)
+    def aggregate(self, alpha):
+        agg = np.zeros(alpha.shape[:-1] + self.y.shape)
+        if self.agg_op == "max":
+            # при max правила с одним термом сливаются: max_r imp(a_r, µ) = imp(max_r a_r, µ)
+            level = self.levels(alpha)
+            for k in range(len(self.output.labels)):
+                np.maximum(agg, self._implied(level[..., k], k), out=agg)
+        else:
+            for r, k in enumerate(self.rule_out):
+                term = self._implied(alpha[..., r], k)
+                agg += term - agg * term
+        return agg
+
+    def _centroid_sampled(self, agg):
+        area = agg @ self.trapz_w
+        moment = agg @ (self.trapz_w * self.y)
+        return np.where(area > 1e-12, moment / np.where(area > 1e-12, area, 1), 0.0)
+
+    def _centroid_exact(self, level):
+        lv = level[..., None, :]                                       # (..., 1, термы)
+        x0, x1, f0, f1 = (self.edges[:, i, None] for i in range(4))    # (стороны, 1)
+        cut = np.clip(x0 + (lv - f0) * (x1 - x0) / (f1 - f0), x0, x1)
+        ys = np.concatenate([np.broadcast_to(self.fixed_breaks, level.shape[:-1] + self.fixed_breaks.shape),
+                             cut.reshape(level.shape[:-1] + (-1,))], axis=-1)
+        ys = np.sort(np.clip(ys, self.output.lo, self.output.hi), axis=-1)
+        # агрегат в изломах с обеих сторон: у термов с вертикальной стороной они различаются
+        left = right = None
+        for k, (xs, fs) in enumerate(self.output.outlines):
+            lv = level[..., k, None]
+            fl = np.minimum(lv, one_sided(ys, xs, fs, "left"))
+            fr = np.minimum(lv, one_sided(ys, xs, fs, "right"))
+            left = fl if left is None else np.maximum(left, fl, out=left)
+            right = fr if right is None else np.maximum(right, fr, out=right)
+        return _centroid_segments(ys, left, right)
+
+    # Чёткий выход по силам правил. method: "exact" — центроид по изломам
+    # (только imp=min, agg=max), "sampled" — trapz по сетке, "auto" — exact, если применим.
+    def defuzz(self, alpha, xs=None, method="auto"):
+        if self.kind == "sugeno":
+            z = self.coef[:, -1] + sum(c * np.asarray(x, float)[..., None] for c, x in zip(self.coef[:, :-1].T, xs))
+            w = alpha.sum(axis=-1)
+            return np.where(w > 1e-12, (alpha * z).sum(axis=-1) / np.where(w > 1e-12, w, 1), 0.0)
+        exact_ok = self.imp_op == "min" and self.agg_op == "max"
+        if method == "exact" and not exact_ok:
+            raise ValueError("точный центроид — только для imp_op='min', agg_op='max'")
+        if method == "exact" or (method == "auto" and exact_ok):
+            return self._centroid_exact(self.levels(alpha))
+        return self._centroid_sampled(self.aggregate(alpha))
+
+    # Пакетный вывод: входы одной формы (или приводимые broadcast) → чёткие выходы той же формы,
+    # кусками по chunk точек. fired=True — ещё и матрица сил правил (..., число правил).
+    def evaluate(self, *xs, chunk=CHUNK, fired=False, method="auto"):
+        xs = np.broadcast_arrays(*(np.asarray(x, float) for x in xs))
+        shape = xs[0].shape
+        xs = [x.ravel() for x in xs]
+        n = len(xs[0])
+        crisp = np.empty(n)
+        alphas = np.empty((n, len(self.rules))) if fired else None
+        for i in range(0, n, chunk):
+            part = [x[i:i + chunk] for x in xs]
+            alpha = self.strengths(*part)
+            crisp[i:i + chunk] = self.defuzz(alpha, part, method)
+            if fired:
+                alphas[i:i + chunk] = alpha
+        crisp = crisp.reshape(shape)
+        if fired:
+            return crisp, alphas.reshape(shape + (len(self.rules),))
+        return crisp
+
+    # Описание системы словарём, пригодным для JSON (обратно — FuzzySystem.from_config)
+    def to_config(self):
+        var = lambda v: {"name": v.name, "lo": v.lo, "hi": v.hi,
+                         "terms": {k: [float(x) for x in pts] for k, pts in v.terms.items()}}
+        output = var(self.output) if self.kind == "mamdani" else \
+            {k: np.asarray(c, float).tolist() for k, c in self.output.items()}
+        return {"kind": self.kind, "inputs": [var(v) for v in self.inputs], "output": output,
+                "rules": [[list(ante), out] for ante, out in self.rules],
+                "and_op": self.and_op, "imp_op": self.imp_op, "agg_op": self.agg_op}
+
+    @classmethod
+    def from_config(cls, cfg, resolution=501):
+        var = lambda d: Variable(d["name"], d["terms"], d["lo"], d["hi"])
+        output = var(cfg["output"]) if cfg["kind"] == "mamdani" else cfg["output"]
+        return cls([var(d) for d in cfg["inputs"]], output, cfg["rules"],
+                   cfg["and_op"], cfg["imp_op"], cfg["agg_op"], resolution)
+
+    # Список сработавших правил по строке матрицы сил: [((термы входов..., терм выхода), α)]
+    def fired_rules(self, alpha):
+        return [((*self.rules[i][0], self.rules[i][1]), float(alpha[i])) for i in np.flatnonzero(alpha > 0)]
+
+
+# Сохранение и загрузка системы как JSON-конфига (см. FuzzySystem.to_config).
+def save_config(path, system):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(system.to_config(), f, ensure_ascii=False, indent=1)
+
+
+def load_config(path):
+    with open(path, encoding="utf-8") as f:
+        return FuzzySystem.from_config(json.load(f))
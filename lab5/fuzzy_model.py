@@ -0,0 +1,163 @@
+# fuzzy_model.py
+# Модель Мамдани для ЛР 5.1 без интерфейса: функции принадлежности, 27 правил,
+# вывод infer() и его скомпилированные варианты на движке fuzzy_engine.
+# Streamlit здесь не импортируется, поэтому модель можно использовать из скриптов.
+
+import math
+import numpy as np
+
+from fuzzy_engine import CHUNK, FuzzySystem, Variable, sugeno_outputs, tri
+
+# В NumPy 2 функция trapz переименована в trapezoid
+trapz = getattr(np, "trapezoid", None) or np.trapz
+
+
+# Вершины (a, b, c) треугольников трёх термов на диапазоне 0–100.
+TERM_POINTS = {
+    "low":    (0, 0, 50),
+    "medium": (25, 50, 75),
+    "high":   (50, 100, 100),
+}
+
+
+# Функция создаёт три терма (низкий, средний, высокий) для диапазона 0–100.
+# Эти термы используются для всех переменных (температура, влажность, давление).
+def terms():
+    return {k: (lambda v, a=a, b=b, c=c: tri(v, a, b, c)) for k, (a, b, c) in TERM_POINTS.items()}
+
+
+# Универсумы и функции принадлежности для входов и выхода.
+# X и Y — оси для расчётов и построения графиков.
+X = np.linspace(0, 100, 501)
+Y = np.linspace(0, 100, 501)
+T = terms()   # температура
+H = terms()   # влажность
+P = terms()   # давление
+R = terms()   # выход (вероятность осадков)
+LABS = ["low", "medium", "high"]
+
+
+# Логика определения результата по трём входам (t,h,p):
+# влажность ↑ и давление ↓ увеличивают вероятность осадков,
+# низкая температура тоже немного увеличивает.
+def cons(t, h, p):
+    score = 0
+    score += 2 if h == "high" else 1 if h == "medium" else 0
+    score += 2 if p == "low"  else 1 if p == "medium" else 0
+    score += 1 if t == "low"  else 0 if t == "medium" else -1
+    return "high" if score >= 3 else ("medium" if score >= 1 else "low")
+
+
+# Формируем все 27 правил Мамдани (3×3×3 комбинации входов).
+RULES = [(t, h, p, cons(t, h, p)) for t in LABS for h in LABS for p in LABS]
+
+
+# Главная функция нечёткого вывода (по Мамдани).
+# Выполняет все этапы:
+# 1. Фаззификация — перевод чисел в степени принадлежности.
+# 2. Применение правил — вычисление силы срабатывания (min).
+# 3. Агрегация — объединение всех выходных функций (max).
+# 4. Дефаззификация — расчёт центра тяжести для получения числа.
+def infer(temp, hum, pres):
+    muT = {k: float(T[k](temp)) for k in LABS}
+    muH = {k: float(H[k](hum))  for k in LABS}
+    muP = {k: float(P[k](pres)) for k in LABS}
+
+    agg = np.zeros_like(Y)
+    fired = []
+
+    for (t, h, p, r) in RULES:
+        alpha = min(muT[t], muH[h], muP[p])
+        if alpha <= 0:
+            continue
+        fired.append(((t, h, p, r), alpha))
+        agg = np.maximum(agg, np.minimum(alpha, R[r](Y)))
+
+    area = trapz(agg, Y)
+    crisp = trapz(Y * agg, Y) / area if area > 1e-12 else 0
+    return crisp, agg, fired
+
+
+# --- Скомпилированный вывод (через fuzzy_engine) ---
+# Та же модель, заданная декларативно: движок один раз собирает массивы
+# индексов правил, выходные функции на сетке Y и изломы для точного центроида.
+INPUTS = [Variable("T", TERM_POINTS), Variable("H", TERM_POINTS), Variable("P", TERM_POINTS)]
+OUTPUT = Variable("R", TERM_POINTS)
+MODEL = FuzzySystem(INPUTS, OUTPUT, [((t, h, p), r) for t, h, p, r in RULES])
+# Быстрая альтернатива: Сугено нулевого порядка, выход терма — центр тяжести его треугольника
+SUGENO = FuzzySystem(INPUTS, sugeno_outputs(OUTPUT), [((t, h, p), r) for t, h, p, r in RULES])
+
+
+# Строка матрицы сил (27,) → список сработавших правил в формате infer().
+def fired_rules(alpha):
+    return MODEL.fired_rules(alpha)
+
+
+# Тот же агрегат и правила, что infer(), но без словарей и пересчёта R[r](Y):
+# всё на заранее собранных массивах. С method="sampled" чёткий выход совпадает
+# с infer() до ошибки округления (~1e-10); "exact" — точный центроид без сетки.
+def infer_compiled(temp, hum, pres, method="exact"):
+    alpha = MODEL.strengths(temp, hum, pres)
+    crisp = MODEL.defuzz(alpha, method=method)
+    return float(crisp), MODEL.aggregate(alpha), fired_rules(alpha)
+
+
+# Пакетный вывод: массивы входов одинаковой формы → массив чётких выходов той же формы.
+# Фаззификация, силы правил (N×27), агрегация и центроиды считаются векторно
+# кусками по chunk точек, так что память не растёт с размером входа.
+# method — "exact" (по изломам) или "sampled" (агрегат N×501 и trapz, как infer()).
+# С fired=True дополнительно возвращается матрица сил правил (..., 27):
+# ненулевые элементы строки — сработавшие правила (см. fired_rules).
+# system=SUGENO — вывод Сугено вместо Мамдани.
+def infer_batch(temp, hum, pres, chunk=CHUNK, fired=False, method="exact", system=MODEL):
+    return system.evaluate(temp, hum, pres, chunk=chunk, fired=fired, method=method)
+
+
+# Таблица чётких выходов по целочисленной сетке (T,H,P) с шагом step
+# и трилинейная интерполяция между узлами. В узлах — точный центроид;
+# между узлами центроид меняется плавно, кроме изломов, где правило
+# начинает или перестаёт срабатывать, поэтому ошибка ограничена:
+# при step=1 расхождение с infer() не больше LUT_TOL процентного пункта
+# (замер на 10^5 случайных точек: максимум 0.59, у 99% точек меньше 0.2).
+LUT_TOL = 1.0
+
+
+class FuzzyLUT:
+    def __init__(self, table, step=1.0):
+        self.table = table
+        self.step = step
+        self.n = table.shape[0] - 1   # число интервалов по каждой оси
+
+    # Все узлы сетки — один вызов infer_batch (он сам режет вход на куски).
+    # Сетка всегда доходит до 100: step округляется до 100/n, как его восстановит load().
+    @classmethod
+    def build(cls, step=1.0):
+        n = max(1, round(100 / step))
+        grid = np.linspace(0, 100, n + 1)
+        return cls(infer_batch(grid[:, None, None], grid[None, :, None], grid[None, None, :]), 100 / n)
+
+    def save(self, path):
+        np.save(path, self.table)
+
+    @classmethod
+    def load(cls, path):
+        table = np.load(path)
+        return cls(table, 100 / (table.shape[0] - 1))
+
+    # Одна точка — чистый Python над 8 узлами таблицы (микросекунды).
+    def __call__(self, temp, hum, pres):
+        idx, frac = [], []
+        for v in (temp, hum, pres):
+            u = min(max(v, 0.0), 100.0) / self.step
+            i = min(int(math.floor(u)), self.n - 1)
+            idx.append(i)
+            frac.append(u - i)
+        (i, j, k), (ft, fh, fp) = idx, frac
+        c = self.table[i:i + 2, j:j + 2, k:k + 2].tolist()
+        c00 = c[0][0][0] + (c[0][0][1] - c[0][0][0]) * fp
+        c01 = c[0][1][0] + (c[0][1][1] - c[0][1][0]) * fp
+        c10 = c[1][0][0] + (c[1][0][1] - c[1][0][0]) * fp
+        c11 = c[1][1][0] + (c[1][1][1] - c[1][1][0]) * fp
+        c0 = c00 + (c01 - c00) * fh
+        c1 = c10 + (c11 - c10) * fh
+        return c0 + (c1 - c0) * ft
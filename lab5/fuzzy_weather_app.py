@@ -4,89 +4,65 @@
 # Используются треугольные функции принадлежности, 27 правил Мамдани
 # и дефаззификация методом центра тяжести. Интерфейс сделан на Streamlit.
 
-import numpy as np
+import io
+import time
+
 import streamlit as st
 import matplotlib.pyplot as plt
 
+from fuzzy_model import X, Y, T, H, P, R, infer, infer_batch, infer_compiled, FuzzyLUT, LUT_TOL, SUGENO
+
+INFER_CACHE = 4096   # сколько последних результатов вывода помнит кэш (вытесняются старые)
+INPUT_MF = {"Температура": T, "Влажность": H, "Давление": P}
+
+
+# Таблица для режима «таблица» строится один раз на процесс сервера (~2 с).
+@st.cache_resource
+def lut():
+    return FuzzyLUT.build()
 
-# Функция треугольной принадлежности:
-# возвращает число от 0 до 1, показывающее, насколько значение x
-# принадлежит терму (a, b, c). Применяется для low, medium, high.
-def tri(x, a, b, c):
-    x = np.asarray(x, float)
-    left = (x - a) / (b - a + 1e-9)
-    right = (c - x) / (c - b + 1e-9)
-    y = np.minimum(left, right)
-    y = np.where((x < a) | (x > c), 0, y)
-    y = np.where(x == b, 1.0, y)
-    return np.clip(y, 0, 1)
-
-
-# Функция создаёт три терма (низкий, средний, высокий) для диапазона 0–100.
-# Эти термы используются для всех переменных (температура, влажность, давление).
-def terms():
-    return {
-        "low":    lambda v: tri(v, 0, 0, 50),
-        "medium": lambda v: tri(v, 25, 50, 75),
-        "high":   lambda v: tri(v, 50, 100, 100)
-    }
-
-
-# Универсумы и функции принадлежности для входов и выхода.
-# X и Y — оси для расчётов и построения графиков.
-X = np.linspace(0, 100, 501)
-Y = np.linspace(0, 100, 501)
-T = terms()   # температура
-H = terms()   # влажность
-P = terms()   # давление
-R = terms()   # выход (вероятность осадков)
-LABS = ["low", "medium", "high"]
-
-
-# Логика определения результата по трём входам (t,h,p):
-# влажность ↑ и давление ↓ увеличивают вероятность осадков,
-# низкая температура тоже немного увеличивает.
-def cons(t, h, p):
-    score = 0
-    score += 2 if h == "high" else 1 if h == "medium" else 0
-    score += 2 if p == "low"  else 1 if p == "medium" else 0
-    score += 1 if t == "low"  else 0 if t == "medium" else -1
-    return "high" if score >= 3 else ("medium" if score >= 1 else "low")
-
-
-# Формируем все 27 правил Мамдани (3×3×3 комбинации входов).
-RULES = [(t, h, p, cons(t, h, p)) for t in LABS for h in LABS for p in LABS]
-
-
-# Главная функция нечёткого вывода (по Мамдани).
-# Выполняет все этапы:
-# 1. Фаззификация — перевод чисел в степени принадлежности.
-# 2. Применение правил — вычисление силы срабатывания (min).
-# 3. Агрегация — объединение всех выходных функций (max).
-# 4. Дефаззификация — расчёт центра тяжести для получения числа.
-def infer(temp, hum, pres):
-    muT = {k: float(T[k](temp)) for k in LABS}
-    muH = {k: float(H[k](hum))  for k in LABS}
-    muP = {k: float(P[k](pres)) for k in LABS}
-
-    agg = np.zeros_like(Y)
-    fired = []
-
-    for (t, h, p, r) in RULES:
-        alpha = min(muT[t], muH[h], muP[p])
-        if alpha <= 0:
-            continue
-        fired.append(((t, h, p, r), alpha))
-        agg = np.maximum(agg, np.minimum(alpha, R[r](Y)))
-
-    area = np.trapz(agg, Y)
-    crisp = np.trapz(Y * agg, Y) / area if area > 1e-12 else 0
+
+# Вывод по тройке входов в выбранном режиме: (чёткий выход, агрегат, сработавшие правила).
+def run_infer(t, h, p, mode):
+    crisp, agg, fired = (infer if mode == "прямой" else infer_compiled)(t, h, p)
+    if mode == "таблица":
+        crisp = lut()(t, h, p)   # график и правила — из скомпилированного вывода
+    elif mode == "Сугено":
+        crisp = float(infer_batch(t, h, p, system=SUGENO))
     return crisp, agg, fired
 
 
+# Тот же вывод с мемоизацией между перезапусками скрипта и сессиями.
+run_infer_cached = st.cache_data(max_entries=INFER_CACHE, show_spinner=False)(run_infer)
+
+
+# Отдельная функция для построения графиков функций принадлежности.
+def mf_figure(x, fns, title):
+    fig, ax = plt.subplots()
+    ax.plot(x, fns["low"](x), label="low")
+    ax.plot(x, fns["medium"](x), label="medium")
+    ax.plot(x, fns["high"](x), label="high")
+    ax.set_title(title)
+    ax.set_xlabel("0–100")
+    ax.set_ylabel("µ (степень принадлежности)")
+    ax.legend()
+    return fig
+
+
+# Графики входов от слайдеров не зависят: рисуются один раз, дальше отдаётся готовый PNG.
+@st.cache_data(show_spinner=False)
+def mf_png(title):
+    fig = mf_figure(X, INPUT_MF[title], title)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    return buf.getvalue()
+
+
 # Интерфейс Streamlit: слайдеры, вывод результата и графики.
 st.set_page_config(page_title="Fuzzy Weather", layout="centered")
 st.title("ЛР 5.1 — Вероятность осадков (нечёткая логика Мамдани)")
+started = time.perf_counter()
 
 col1, col2 = st.columns(2)
 with col1:
@@ -95,8 +71,17 @@ with col1:
 with col2:
     p = st.slider("Давление (0–100)",    0, 100, 30)
 
+mode = st.radio("Вывод", ["прямой", "скомпилированный", "таблица", "Сугено"], index=1, horizontal=True,
+                help="прямой — исходный infer(); скомпилированный — готовые массивы и точный центроид без сетки; "
+                     f"таблица — интерполяция по сетке 101³ (точность ±{LUT_TOL} п.п.); "
+                     "Сугено — те же правила, выход терма — константа (центр его треугольника)")
+cached = st.sidebar.checkbox("Кэширование", value=True,
+                             help="Выключите, чтобы сравнить задержку перезапуска без кэша (как было раньше)")
+
 # Расчёт результата
-crisp, agg, fired = infer(t, h, p)
+t0 = time.perf_counter()
+crisp, agg, fired = (run_infer_cached if cached else run_infer)(t, h, p, mode)
+infer_ms = (time.perf_counter() - t0) * 1000
 st.subheader(f"Вероятность осадков: **{crisp:.1f}%**")
 
 # Текстовая интерпретация результата
@@ -107,36 +92,39 @@ with st.expander("Сработавшие правила"):
     for (t_, h_, p_, r_), a in sorted(fired, key=lambda x: x[1], reverse=True)[:10]:
         st.write(f"ЕСЛИ T={t_}, H={h_}, P={p_} → R={r_}  (α={a:.2f})")
 
-
-# Отдельная функция для построения графиков функций принадлежности.
-def show_mf(x, fns, title):
-    fig, ax = plt.subplots()
-    ax.plot(x, fns["low"](x), label="low")
-    ax.plot(x, fns["medium"](x), label="medium")
-    ax.plot(x, fns["high"](x), label="high")
-    ax.set_title(title)
-    ax.set_xlabel("0–100")
-    ax.set_ylabel("µ (степень принадлежности)")
-    ax.legend()
-    st.pyplot(fig)
-
-
-# Визуализация функций принадлежности входных переменных
-st.subheader("Функции принадлежности (входные)")
-show_mf(X, T, "Температура")
-show_mf(X, H, "Влажность")
-show_mf(X, P, "Давление")
-
-# Визуализация выходной переменной (до и после агрегации)
-st.subheader("Выходная функция (вероятность осадков)")
-fig2, ax2 = plt.subplots()
-ax2.plot(Y, R["low"](Y), label="low (эталон)")
-ax2.plot(Y, R["medium"](Y), label="medium (эталон)")
-ax2.plot(Y, R["high"](Y), label="high (эталон)")
-ax2.plot(Y, agg, label="агрегированный выход", linewidth=2, color="red")
-ax2.set_xlabel("0–100%")
-ax2.set_ylabel("µ")
-ax2.legend()
-st.pyplot(fig2)
+# Графики строятся, только когда их включили (содержимое st.expander выполняется всегда).
+t0 = time.perf_counter()
+if st.checkbox("Функции принадлежности (входные)", value=not cached):
+    for title, fns in INPUT_MF.items():
+        if cached:
+            st.image(mf_png(title))
+        else:
+            st.pyplot(mf_figure(X, fns, title))
+
+# Визуализация выходной переменной (до и после агрегации) — зависит от входа, не кэшируется
+if st.checkbox("Выходная функция (вероятность осадков)", value=not cached):
+    fig2, ax2 = plt.subplots()
+    ax2.plot(Y, R["low"](Y), label="low (эталон)")
+    ax2.plot(Y, R["medium"](Y), label="medium (эталон)")
+    ax2.plot(Y, R["high"](Y), label="high (эталон)")
+    ax2.plot(Y, agg, label="агрегированный выход", linewidth=2, color="red")
+    ax2.set_xlabel("0–100%")
+    ax2.set_ylabel("µ")
+    ax2.legend()
+    st.pyplot(fig2)
+    plt.close(fig2)
+plot_ms = (time.perf_counter() - t0) * 1000
 
 st.caption("Модель Мамдани: AND=min, импликация=обрезка, агрегация=max, дефаззификация=центроид.")
+
+# Панель времени: задержка этого перезапуска и средние по последним перезапускам с кэшем и без.
+total_ms = (time.perf_counter() - started) * 1000
+history = st.session_state.setdefault("timings", [])
+history.append((cached, total_ms))
+del history[:-50]
+with st.sidebar.expander("Время перезапуска", expanded=True):
+    st.write(f"вывод: {infer_ms:.2f} мс, графики: {plot_ms:.1f} мс, всего: {total_ms:.1f} мс")
+    for flag, name in ((False, "без кэша"), (True, "с кэшем")):
+        runs = [ms for c, ms in history if c == flag]
+        if runs:
+            st.write(f"{name}: {sum(runs) / len(runs):.1f} мс в среднем ({len(runs)} перезапусков)")
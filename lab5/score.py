@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# score.py
+# Пакетная оценка вероятности осадков по архиву наблюдений (без интерфейса).
+# CSV или Parquet читается кусками по --chunk строк; температура, влажность и
+# давление линейно переводятся из физических диапазонов в универсумы 0–100,
+# каждый кусок считается векторным infer_batch (при --workers > 1 — в пуле процессов),
+# а к строкам дописываются столбцы precip_prob (чёткий выход, %), rule — правило
+# с наибольшей силой срабатывания — и его сила rule_alpha. Строки с пропусками
+# во входах получают пустые значения. В конце печатается скорость в строках/с.
+# Типы столбцов фиксируются по первому куску (целые с пропусками остаются целыми),
+# а результат пишется во временный файл и переименовывается только после успеха.
+# --config — модель из JSON-конфига (например, после tune.py) вместо встроенной.
+
+import argparse, os, time
+from itertools import islice
+from multiprocessing import Pool
+import numpy as np
+import pandas as pd
+
+from fuzzy_engine import load_config
+from fuzzy_model import MODEL, SUGENO, infer_batch
+
+
+# Имена правил системы; последний элемент — пустое имя для строк без результата.
+def rule_names(system):
+    return np.array([" ".join(f"{v.name}={t}" for v, t in zip(system.inputs, ante) if t is not None) + f" → {out}"
+                     for ante, out in system.rules] + [""])
+
+
+# Физическое значение → универсум 0–100 (линейно, с обрезанием по краям диапазона).
+def to_universe(v, lo, hi):
+    return np.clip((np.asarray(v, float) - lo) * (100.0 / (hi - lo)), 0.0, 100.0)
+
+
+# Столбец таблицы → массив float (пропуски, в том числе Arrow-null, → NaN).
+def column(df, name):
+    return df[name].to_numpy(float, na_value=np.nan)
+
+
+# Входы куска из столбцов таблицы по опциям --*-col / --*-range.
+def inputs_from(df, args):
+    return (to_universe(column(df, args.temp_col), *args.temp_range),
+            to_universe(column(df, args.hum_col), *args.hum_range),
+            to_universe(column(df, args.pres_col), *args.pres_range))
+
+
+# Оценка одного куска (входы уже в 0–100): чёткий выход, номер главного правила и его сила.
+# Если ни одно правило не сработало (у подобранных термов бывают промежутки), правило пустое,
+# а сила — NaN.
+def score(temp, hum, pres, system=MODEL):
+    n = len(temp)
+    ok = ~(np.isnan(temp) | np.isnan(hum) | np.isnan(pres))
+    crisp = np.full(n, np.nan)
+    rule = np.full(n, len(system.rules))   # последний номер → пустое имя правила
+    strength = np.full(n, np.nan)
+    c, alpha = infer_batch(temp[ok], hum[ok], pres[ok], fired=True, system=system)
+    best = alpha.argmax(axis=1)
+    top = alpha[np.arange(len(best)), best]
+    fired = top > 0
+    crisp[ok] = c
+    rule[ok] = np.where(fired, best, len(system.rules))
+    strength[ok] = np.where(fired, top, np.nan)
+    return crisp, rule, strength
+
+
+def _score_task(task):
+    return score(*task)
+
+
+# Чтение кусками: Parquet — по группам записей через pyarrow, остальное — как CSV.
+# Столбцы — на типах Arrow, чтобы целые с пропусками не становились float64 только
+# в тех кусках, где пропуски есть; для CSV типы берутся из первого куска
+# (кроме столбцов, пустых в нём целиком) и задаются всем остальным.
+def read_chunks(path, chunk):
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk):
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        first = pd.read_csv(path, nrows=chunk, dtype_backend="pyarrow")
+        dtypes = {c: t for c, t in first.dtypes.items() if first[c].notna().any()}
+        yield from pd.read_csv(path, chunksize=chunk, dtype=dtypes, dtype_backend="pyarrow")
+
+
+# Запись кусками в тот же формат: CSV дописывается, Parquet — группами строк одного файла
+# со схемой первого куска (остальные приводятся к ней). Пишется во временный файл,
+# который close(ok=True) переименовывает в итоговый, а close(ok=False) удаляет.
+class ChunkWriter:
+    def __init__(self, path):
+        self.path = path
+        self.tmp = path + ".tmp"
+        self.parquet = path.endswith(".parquet")
+        self.writer = None
+        self.schema = None
+        self.first = True
+
+    def write(self, df):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, schema=self.schema, preserve_index=False)
+            if self.writer is None:
+                self.schema = table.schema
+                self.writer = pq.ParquetWriter(self.tmp, self.schema)
+            self.writer.write_table(table)
+        else:
+            df.to_csv(self.tmp, mode="w" if self.first else "a", header=self.first, index=False)
+        self.first = False
+
+    def close(self, ok=True):
+        if self.writer is not None:
+            self.writer.close()
+        if ok and not self.first:
+            os.replace(self.tmp, self.path)
+        elif os.path.exists(self.tmp):
+            os.remove(self.tmp)
+
+
+# Таблица целиком (для небольших файлов, например в tune.py).
+def read_table(path):
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+
+# Опции столбцов и физических диапазонов входов (общие со tune.py).
+def add_input_args(ap):
+    ap.add_argument("--temp-col", default="temperature", help="Столбец температуры")
+    ap.add_argument("--hum-col", default="humidity", help="Столбец влажности")
+    ap.add_argument("--pres-col", default="pressure", help="Столбец давления")
+    ap.add_argument("--temp-range", type=float, nargs=2, default=[-30.0, 40.0], metavar=("LO", "HI"),
+                    help="Физический диапазон температуры, отображаемый на 0–100 (°C)")
+    ap.add_argument("--hum-range", type=float, nargs=2, default=[0.0, 100.0], metavar=("LO", "HI"),
+                    help="Диапазон влажности (%%)")
+    ap.add_argument("--pres-range", type=float, nargs=2, default=[960.0, 1060.0], metavar=("LO", "HI"),
+                    help="Диапазон давления (гПа)")
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Lab 5: пакетная оценка вероятности осадков (CSV/Parquet)")
+    ap.add_argument("input", help="Входной файл .csv или .parquet")
+    ap.add_argument("output", help="Выходной файл .csv или .parquet (входные столбцы + результат)")
+    add_input_args(ap)
+    ap.add_argument("--chunk", type=int, default=200_000, help="Строк в куске чтения")
+    ap.add_argument("--workers", type=int, default=1, help="Процессов в пуле")
+    ap.add_argument("--sugeno", action="store_true", help="Вывод Сугено вместо Мамдани")
+    ap.add_argument("--config", type=str, default=None, help="JSON-конфиг модели (например, из tune.py)")
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    system = load_config(args.config) if args.config else SUGENO if args.sugeno else MODEL
+    names = rule_names(system)
+    started = time.perf_counter()
+    reader = read_chunks(args.input, args.chunk)
+    writer = ChunkWriter(args.output)
+    pool = Pool(args.workers) if args.workers > 1 else None
+    rows = 0
+    ok = False
+    try:
+        while True:
+            # в памяти не больше 2 кусков на процесс: читаем окно, считаем, пишем
+            window = list(islice(reader, 2 * max(1, args.workers)))
+            if not window:
+                break
+            tasks = [(*inputs_from(df, args), system) for df in window]
+            results = pool.map(_score_task, tasks) if pool else map(_score_task, tasks)
+            for df, (crisp, rule, strength) in zip(window, results):
+                df["precip_prob"] = crisp
+                df["rule"] = names[rule]
+                df["rule_alpha"] = strength
+                writer.write(df)
+                rows += len(df)
+        ok = True
+    finally:
+        writer.close(ok)
+        if pool:
+            pool.close()
+            pool.join()
+    elapsed = time.perf_counter() - started
+    print(f"{rows} строк за {elapsed:.2f} с: {rows / max(elapsed, 1e-9):,.0f} строк/с → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
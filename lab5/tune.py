@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# tune.py
+# Подгонка модели Мамдани по размеченной истории наблюдений.
+# Каждая переменная (T, H, P и выход R) получает свои вершины термов — 5 чисел:
+# правая вершина low, три вершины medium и левая вершина high (края 0 и 100
+# остаются на месте). С --rules подбираются и выходные термы 27 правил.
+# Поиск — дифференциальная эволюция scipy по RMSE чёткого выхода относительно
+# целевого столбца; каждый кандидат считается пакетным выводом по всем строкам
+# выборки, поколение популяции — в пуле процессов (--workers).
+# Результат — JSON-конфиг FuzzySystem (fuzzy_engine.load_config, score.py --config).
+
+import argparse, time
+import numpy as np
+
+from fuzzy_engine import FuzzySystem, Variable, save_config
+from fuzzy_model import LABS, MODEL, TERM_POINTS
+from score import add_input_args, inputs_from, read_table
+
+VARS = ["T", "H", "P", "R"]
+N_TERM = 5   # параметров термов на переменную
+
+
+# Вершины термов → 5 параметров и обратно (medium сортируется, чтобы треугольник был корректным).
+def term_params(points):
+    return [points["low"][2], *points["medium"], points["high"][0]]
+
+
+def terms_from(v):
+    lc, ma, mb, mc, ha = v
+    ma, mb, mc = sorted((ma, mb, mc))
+    return {"low": (0.0, 0.0, max(lc, 1e-3)), "medium": (ma, mb, mc), "high": (min(ha, 100 - 1e-3), 100.0, 100.0)}
+
+
+# Вектор параметров → система: 4×5 вершин, затем (с подбором правил) 27 номеров выходных термов.
+def decode(theta, tune_rules=False):
+    vs = [Variable(name, terms_from(theta[N_TERM * i:N_TERM * (i + 1)])) for i, name in enumerate(VARS)]
+    rules = MODEL.rules
+    if tune_rules:
+        rules = [(ante, LABS[int(round(k))]) for (ante, _), k in zip(MODEL.rules, theta[N_TERM * len(VARS):])]
+    return FuzzySystem(vs[:3], vs[3], rules)
+
+
+# Вектор параметров исходной модели (стартовая точка поиска).
+def initial(tune_rules=False):
+    theta = term_params(TERM_POINTS) * len(VARS)
+    if tune_rules:
+        theta += [LABS.index(out) for _, out in MODEL.rules]
+    return np.array(theta, float)
+
+
+# Целевая функция: RMSE модели на выборке. Класс, а не замыкание, — чтобы передавать в пул процессов.
+class Objective:
+    def __init__(self, x, target, tune_rules=False):
+        self.x = x
+        self.target = target
+        self.tune_rules = tune_rules
+
+    def __call__(self, theta):
+        pred = decode(theta, self.tune_rules).evaluate(*self.x)
+        return float(np.sqrt(np.mean((pred - self.target) ** 2)))
+
+
+# Подбор параметров. Возврат: (система, результат differential_evolution).
+def tune(x, target, tune_rules=False, maxiter=100, popsize=15, workers=1, seed=0):
+    from scipy.optimize import differential_evolution   # необязательная зависимость, нужна только здесь
+    n_rules = len(MODEL.rules) if tune_rules else 0
+    bounds = [(0.0, 100.0)] * (N_TERM * len(VARS)) + [(0, len(LABS) - 1)] * n_rules
+    integrality = [False] * (N_TERM * len(VARS)) + [True] * n_rules
+    res = differential_evolution(Objective(x, target, tune_rules), bounds, x0=initial(tune_rules),
+                                 maxiter=maxiter, popsize=popsize, seed=seed, polish=False,
+                                 integrality=integrality, workers=workers,
+                                 updating="deferred" if workers != 1 else "immediate")
+    return decode(res.x, tune_rules), res
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Lab 5: подбор функций принадлежности по размеченным данным")
+    ap.add_argument("input", help="Файл .csv или .parquet с входами и целевым столбцом")
+    ap.add_argument("--target", default="precip", help="Целевой столбец (вероятность осадков)")
+    ap.add_argument("--target-scale", type=float, default=1.0,
+                    help="Множитель цели до шкалы 0–100 (100 — для меток 0/1)")
+    add_input_args(ap)
+    ap.add_argument("--rules", action="store_true", help="Подбирать и выходные термы правил")
+    ap.add_argument("--sample", type=int, default=1000, help="Строк в обучающей выборке (0 — все)")
+    ap.add_argument("--holdout", type=float, default=0.2, help="Доля строк для проверки")
+    ap.add_argument("--maxiter", type=int, default=100, help="Поколений эволюции")
+    ap.add_argument("--popsize", type=int, default=15, help="Множитель размера популяции (scipy popsize)")
+    ap.add_argument("--workers", type=int, default=1, help="Процессов для оценки популяции (-1 — все ядра)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", default="tuned_model.json", help="JSON-конфиг подобранной модели")
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    df = read_table(args.input)
+    x = np.stack(inputs_from(df, args))
+    y = df[args.target].to_numpy(float) * args.target_scale
+    ok = ~np.isnan(x).any(axis=0) & ~np.isnan(y)
+    x, y = x[:, ok], y[ok]
+
+    idx = np.random.default_rng(args.seed).permutation(len(y))
+    n_test = int(len(y) * args.holdout)
+    test, train = idx[:n_test], idx[n_test:]
+    if args.sample:
+        train = train[:args.sample]
+
+    base = Objective(x[:, train], y[train])(initial())
+    started = time.perf_counter()
+    system, res = tune(x[:, train], y[train], args.rules, args.maxiter, args.popsize, args.workers, args.seed)
+    elapsed = time.perf_counter() - started
+    save_config(args.out, system)
+
+    print(f"обучение: {len(train)} строк, RMSE {base:.3f} → {res.fun:.3f}")
+    if n_test:
+        rmse = lambda s: float(np.sqrt(np.mean((s.evaluate(*x[:, test]) - y[test]) ** 2)))
+        print(f"проверка: {n_test} строк, RMSE {rmse(MODEL):.3f} → {rmse(system):.3f}")
+    print(f"{res.nfev} оценок за {elapsed:.1f} с ({res.nfev / elapsed:,.0f} в секунду) → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
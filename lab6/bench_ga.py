@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Бенчмарк векторного ГА (ga.GA): время поколения в зависимости от размера популяции N
+# и длины хромосомы L; для сравнения — строковый цикл в духе main.py (без печати).
+# Столбец «decode» — сверка decode с точным int(bits, 2) / (2^L - 1) (деление целых Python) на первых хромосомах
+# (в том числе для L >= 1024, где 2.0 ** L уже не представимо).
+
+import argparse, math, random, time
+import numpy as np
+from ga import GA, decode, to_strings
+
+
+# Одно поколение на строках, как в main.py: два лучших родителя, кроссовер и мутация по символам.
+def string_generation(pop, L, pc, pm):
+    fit = lambda b: (lambda x: x * math.sin(6 * math.pi * x) + 0.5 * math.cos(4 * math.pi * x) + 1)(int(b, 2) / (2 ** L - 1))
+    p1, p2 = sorted(pop, key=fit, reverse=True)[:2]
+    new = []
+    while len(new) < len(pop):
+        c1, c2 = p1, p2
+        if random.random() < pc:
+            k = random.randint(1, L - 1)
+            c1, c2 = p1[:k] + p2[k:], p2[:k] + p1[k:]
+        for c in (c1, c2):
+            c = "".join(("1" if b == "0" else "0") if random.random() < pm else b for b in c)
+            if len(new) < len(pop):
+                new.append(c)
+    return new
+
+
+def parse_args():
+    ap = argparse.ArgumentParser(description="Бенчмарк векторного генетического алгоритма")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Размеры популяции N")
+    ap.add_argument("--lengths", type=int, nargs="+", default=[4, 64, 256, 1030], help="Длины хромосомы L")
+    ap.add_argument("--steps", type=int, default=10, help="Поколений на замер")
+    ap.add_argument("--selection", choices=["best2", "tournament"], default="best2")
+    ap.add_argument("--baseline-max", type=int, default=1_000_000, help="Наибольшее N·L для строкового цикла")
+    return ap.parse_args()
+
+
+def main():
+    args = parse_args()
+    print(f"поколений на замер={args.steps}, отбор={args.selection}")
+    print(f"{'N':>8} {'L':>5} {'мс/пок.':>9} {'строки, мс':>11} {'ускорение':>10} {'decode':>7}")
+    for L in args.lengths:
+        for n in args.sizes:
+            ga = GA(n, L, seed=0, selection=args.selection)
+            t0 = time.perf_counter()
+            ga.run(args.steps)
+            t = (time.perf_counter() - t0) / args.steps
+            sample = ga.pop[:100]
+            exact = [int(b, 2) / (2 ** L - 1) for b in to_strings(sample, L)]
+            ok = "ok" if np.allclose(decode(sample, L), exact, rtol=0, atol=1e-15) else "ОШИБКА"
+            if n * L <= args.baseline_max:
+                pop = ["".join(random.choice("01") for _ in range(L)) for _ in range(n)]
+                t0 = time.perf_counter()
+                for _ in range(args.steps):
+                    pop = string_generation(pop, L, ga.pc, ga.pm)
+                base = (time.perf_counter() - t0) / args.steps
+                print(f"{n:8d} {L:5d} {t * 1e3:9.2f} {base * 1e3:11.2f} {base / t:10.1f} {ok:>7}")
+            else:
+                print(f"{n:8d} {L:5d} {t * 1e3:9.2f} {'—':>11} {'—':>10} {ok:>7}")
+
+
+if __name__ == "__main__":
+    main()
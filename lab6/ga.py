@@ -0,0 +1,148 @@
+# ga.py
+# Векторный генетический алгоритм: вся популяция — один массив NumPy.
+# Хромосома длины L хранится упакованной в W = ceil(L/64) слов uint64
+# (старшие биты хромосомы — в слове 0, лишние старшие биты слова 0 равны нулю),
+# поэтому отбор, одноточечный кроссовер (маски по словам), мутация (XOR с маской
+# случайных битов), декодирование и f(x) считаются сразу для всей популяции.
+# Схема поколения та же, что в main.py: пары потомков, кроссовер с вероятностью pc
+# в точке 1..L-1, мутация каждого бита с вероятностью pm. Родители — два лучших
+# (selection="best2", как в main.py) или турнир из k случайных на каждую пару ("tournament").
+
+import numpy as np
+
+WORD = 64
+BLOCK = 1 << 22   # бит маски мутаций на кусок: временный массив — BLOCK float32, а не N×L
+# TOP[k] — маска из k старших битов слова (k = 0..64)
+TOP = np.array([((1 << k) - 1) << (WORD - k) for k in range(WORD + 1)], dtype=np.uint64)
+ALL = TOP[WORD]
+
+
+# Целевая функция (вариант 1) для массива x:
+# f(x) = x * sin(6πx) + 0.5 * cos(4πx) + 1
+def f(x):
+    return x * np.sin(6 * np.pi * x) + 0.5 * np.cos(4 * np.pi * x) + 1
+
+
+def words(L):
+    """Число слов uint64 на хромосому длины L."""
+    return (L + WORD - 1) // WORD
+
+
+def pack(bits):
+    """Биты (N, L) (bool/0-1, старший — первый) → упакованная популяция (N, W) uint64."""
+    n, L = bits.shape
+    padded = np.zeros((n, words(L) * WORD), dtype=np.uint8)
+    padded[:, padded.shape[1] - L:] = bits
+    return np.packbits(padded, axis=1).view(">u8").astype(np.uint64)
+
+
+def unpack(pop, L):
+    """Упакованная популяция → биты (N, L) uint8."""
+    return np.unpackbits(pop.astype(">u8").view(np.uint8), axis=1)[:, pop.shape[1] * WORD - L:]
+
+
+def mutation_mask(rng, n, L, pm, block=BLOCK):
+    """Маска мутаций (n, W): каждый бит взведён с вероятностью pm; считается кусками строк."""
+    flips = np.empty((n, words(L)), dtype=np.uint64)
+    rows = max(1, block // L)
+    for i in range(0, n, rows):
+        m = min(rows, n - i)
+        flips[i:i + m] = pack(rng.random((m, L), dtype=np.float32) < pm)
+    return flips
+
+
+def to_strings(pop, L):
+    """Хромосомы строками «0101» (для вывода)."""
+    return ["".join(map(str, row)) for row in unpack(pop, L).tolist()]
+
+
+def decode(pop, L):
+    """Хромосомы → x ∈ [0, 1]: целое значение / (2^L - 1); при L <= 53 — точно как int(bits, 2)."""
+    if L <= 53:
+        return pop[:, -1].astype(np.float64) / (2.0 ** L - 1)
+    # Длинные хромосомы: слова сразу делятся на 2^L (ldexp не переполняется при любом L),
+    # затем x = значение / 2^L * 2^L / (2^L - 1)
+    exp = WORD * np.arange(pop.shape[1] - 1, -1, -1) - L
+    return np.ldexp(pop.astype(np.float64), exp).sum(axis=1) / (1.0 - np.ldexp(1.0, -L))
+
+
+class GA:
+    def __init__(self, n, L=4, pc=0.8, pm=0.05, seed=None, selection="best2", tournament=2, fitness=f):
+        if L < 2:
+            raise ValueError("длина хромосомы L должна быть не меньше 2 (точка кроссовера 1..L-1)")
+        if selection not in ("best2", "tournament"):
+            raise ValueError(f"неизвестный отбор: {selection}")
+        self.n, self.L, self.pc, self.pm = n, L, pc, pm
+        self.selection, self.tournament = selection, tournament
+        self.fitness = fitness
+        self.rng = np.random.default_rng(seed)
+        self.W = words(L)
+        self.pad = self.W * WORD - L   # незанятые старшие биты слова 0
+        # Начальная популяция: случайные слова, лишние старшие биты слова 0 обнулены
+        self.pop = self.rng.integers(0, 2**64, size=(n, self.W), dtype=np.uint64, endpoint=False)
+        self.pop[:, 0] &= ~TOP[self.pad]
+
+    def evaluate(self):
+        """x и f(x) всей популяции."""
+        xs = decode(self.pop, self.L)
+        return xs, self.fitness(xs)
+
+    def _parents(self, fs, pairs):
+        """Номера родителей (pairs, 2)."""
+        if self.selection == "best2":
+            # два лучших; при равенстве — с меньшим номером, как sorted(..., reverse=True) в main.py
+            i1 = int(np.argmax(fs))
+            rest = fs.copy()
+            rest[i1] = -np.inf
+            i2 = int(np.argmax(rest))
+            return np.broadcast_to(np.array([i1, i2]), (pairs, 2))
+        cand = self.rng.integers(0, self.n, size=(pairs, 2, self.tournament))
+        best = np.argmax(fs[cand], axis=-1)
+        return np.take_along_axis(cand, best[..., None], axis=-1)[..., 0]
+
+    def step(self, fs):
+        """
+        Новое поколение из текущего по значениям fs.
+        Возврат: подробности для трассировки — parents (пары, 2), crossed (пары,),
+        points (пары,), children (N, W) — потомки до мутации и flips (N, W) — маски мутаций.
+        """
+        pairs = (self.n + 1) // 2
+        parents = self._parents(fs, pairs)
+        p1, p2 = self.pop[parents[:, 0]], self.pop[parents[:, 1]]
+
+        # Кроссовер: первые point битов первого потомка — от p1, остальные — от p2
+        crossed = self.rng.random(pairs) < self.pc
+        points = self.rng.integers(1, self.L, size=pairs)
+        k = np.clip(self.pad + points[:, None] - WORD * np.arange(self.W), 0, WORD)
+        mask = np.where(crossed[:, None], TOP[k], ALL)
+        c1 = (p1 & mask) | (p2 & ~mask)
+        c2 = (p2 & mask) | (p1 & ~mask)
+
+        # Пары потомков подряд: c1, c2, c1, c2, ...; при нечётном N последний c2 отбрасывается
+        children = np.stack([c1, c2], axis=1).reshape(-1, self.W)[:self.n]
+        # Мутация: XOR с маской битов, выпавших с вероятностью pm
+        flips = mutation_mask(self.rng, self.n, self.L, self.pm)
+        self.pop = children ^ flips
+        return {"parents": parents, "crossed": crossed, "points": points, "children": children, "flips": flips}
+
+    def run(self, generations, observer=None):
+        """
+        generations поколений. Возврат: best_f_history — max f(x) каждого поколения.
+        observer(g, pop, xs, fs, info) вызывается после каждого шага: pop, xs, fs — поколение g,
+        info — подробности step(). Наблюдатель не трогает rng, поэтому история от него не зависит.
+        """
+        best_f_history = []
+        for g in range(generations):
+            pop = self.pop
+            xs, fs = self.evaluate()
+            best_f_history.append(float(fs.max()))
+            info = self.step(fs)
+            if observer is not None:
+                observer(g, pop, xs, fs, info)
+        return best_f_history
+
+    def best(self):
+        """Лучшая хромосома текущей популяции: (x*, f(x*))."""
+        xs, fs = self.evaluate()
+        i = int(np.argmax(fs))
+        return float(xs[i]), float(fs[i])
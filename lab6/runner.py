@@ -0,0 +1,155 @@
+# runner.py
+# Неинтерактивный прогон ГА (ga.GA) с настраиваемой подробностью вывода:
+#   silent  — ничего не печатается;
+#   summary — одна строка на поколение (max/min/avg f и лучший x) и итог;
+#   trace   — полный протокол, как в старом main.py: таблица хромосом, родители,
+#             точки кроссовера и мутации. Протокол собирается в фоновом потоке:
+#             главный поток только кладёт в очередь ссылки на массивы поколения,
+#             а поток-писатель форматирует их и пишет большими блоками — текстом
+#             или структурированным JSONL (по строке на поколение).
+# Вывод не трогает генератор случайных чисел, поэтому best_f_history при любом
+# уровне одинакова.
+
+import json, queue, sys, threading, time
+import numpy as np
+
+from ga import GA, to_strings, unpack
+
+LEVELS = ["silent", "summary", "trace"]
+
+
+# Таблица поколения в формате старого main.py.
+def table(chroms, xs, fs):
+    lines = ["№  хромосома   x       f(x)"]
+    lines += [f"{i:2d}  {ch}   {xv:6.3f}  {fv:8.4f}" for i, (ch, xv, fv) in enumerate(zip(chroms, xs, fs), start=1)]
+    return lines
+
+
+# Строка сводки поколения.
+def summary_line(g, xs, fs):
+    i = int(np.argmax(fs))
+    return f"Поколение {g}: max={fs[i]:.4f}, min={fs.min():.4f}, avg={fs.mean():.4f}, лучший x={xs[i]:.4f}"
+
+
+# Одно поколение трассировки → словарь для JSONL.
+def trace_record(g, pop, xs, fs, info, L):
+    child, bit = np.nonzero(unpack(info["flips"], L))
+    return {
+        "gen": g,
+        "population": to_strings(pop, L),
+        "x": xs.tolist(),
+        "f": fs.tolist(),
+        "parents": info["parents"].tolist(),
+        "crossover": np.where(info["crossed"], info["points"], 0).tolist(),   # 0 — кроссовер не выполнен
+        "mutations": np.stack([child, bit], axis=1).tolist(),                # [номер потомка, бит]
+    }
+
+
+# Одно поколение трассировки → текст как в старом main.py.
+def trace_text(g, pop, xs, fs, info, L):
+    chroms = to_strings(pop, L)
+    children = to_strings(info["children"], L)
+    flips = unpack(info["flips"], L)
+    lines = [f"\nПоколение {g}", *table(chroms, xs, fs), summary_line(g, xs, fs)]
+    for k, (i1, i2) in enumerate(info["parents"].tolist()):
+        lines.append(f"\nРодители: {chroms[i1]}, {chroms[i2]}")
+        pair = children[2 * k:2 * k + 2]
+        if info["crossed"][k]:
+            lines.append(f"Кроссовер в точке {info['points'][k]}: {', '.join(pair)}")
+        else:
+            lines.append("Кроссовер не выполнен")
+        for j, ch in enumerate(pair):
+            for b in np.flatnonzero(flips[2 * k + j]).tolist():
+                lines.append(f"Мутация: у {j + 1}-го потомка бит {b} {ch[b]}->{'1' if ch[b] == '0' else '0'}")
+    return "\n".join(lines) + "\n"
+
+
+# Фоновый писатель протокола: observer для GA.run, очередь ограничена,
+# чтобы при медленном диске память не росла без предела.
+class TraceWriter:
+    def __init__(self, out, L, jsonl=False, maxsize=8):
+        self.out = out
+        self.L = L
+        self.format = trace_record if jsonl else trace_text
+        self.jsonl = jsonl
+        self.q = queue.Queue(maxsize)
+        self.error = None
+        self.thread = threading.Thread(target=self._work, daemon=True)
+        self.thread.start()
+
+    def __call__(self, g, pop, xs, fs, info):
+        if self.error is not None:
+            raise self.error
+        self.q.put((g, pop, xs, fs, info))
+
+    # Ошибку записи (например, закрытый канал) запоминаем и дальше только разбираем очередь,
+    # чтобы главный поток не повис на put(); сама ошибка поднимается в __call__/close.
+    def _work(self):
+        while True:
+            item = self.q.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                rec = self.format(*item, self.L)
+                self.out.write(json.dumps(rec, ensure_ascii=False) + "\n" if self.jsonl else rec)
+            except Exception as e:
+                self.error = e
+
+    def close(self):
+        self.q.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+        self.out.flush()
+
+
+class Result:
+    def __init__(self, ga, best_f_history, elapsed):
+        self.ga = ga
+        self.best_f_history = best_f_history
+        self.xs, self.fs = ga.evaluate()
+        i = int(np.argmax(self.fs))
+        self.x_best, self.f_best = float(self.xs[i]), float(self.fs[i])
+        self.elapsed = elapsed
+
+
+def run(n=4, L=4, pc=0.8, pm=0.05, generations=30, seed=None, selection="best2",
+        level="summary", out=None, trace_path=None):
+    """
+    Прогон ГА. level — "silent" | "summary" | "trace"; out — поток для текста (по умолчанию stdout).
+    С level="trace" и trace_path протокол пишется в JSONL-файл, иначе — текстом в out.
+    Возврат: Result (best_f_history, последнее поколение xs/fs, x_best, f_best, elapsed).
+    """
+    if level not in LEVELS:
+        raise ValueError(f"неизвестный уровень вывода: {level}")
+    out = out or sys.stdout
+    ga = GA(n, L, pc, pm, seed=seed, selection=selection)
+    observer = writer = None
+    if level == "summary":
+        observer = lambda g, pop, xs, fs, info: out.write(summary_line(g, xs, fs) + "\n")
+    elif level == "trace":
+        jsonl = trace_path is not None
+        observer = writer = TraceWriter(open(trace_path, "w", encoding="utf-8") if jsonl else out, L, jsonl)
+
+    if level != "silent":
+        out.write(f"ГЕНЕТИЧЕСКИЙ АЛГОРИТМ\nN={n}, pc={pc}, pm={pm}, G={generations}, L={L}, отбор={selection}\n")
+    t0 = time.perf_counter()
+    try:
+        best_f_history = ga.run(generations, observer)
+    finally:
+        if writer is not None:
+            try:
+                writer.close()
+            finally:
+                if writer.jsonl:
+                    writer.out.close()
+    res = Result(ga, best_f_history, time.perf_counter() - t0)
+
+    if level != "silent":
+        out.write(f"\nРЕЗУЛЬТАТ\nЛучшее найденное x* = {res.x_best:.4f}\nf(x*) = {res.f_best:.4f}\n")
+        if level == "trace" and trace_path is None:
+            out.write("\nПоследнее поколение:\n" + "\n".join(table(to_strings(ga.pop, L), res.xs, res.fs)) + "\n")
+        out.write(f"{generations} поколений за {res.elapsed:.3f} с\n")
+    return res